@@ -0,0 +1,171 @@
+"""Long user-facing messages for the platform module.
+
+Kept out of platform.py so the module stays small; imported on demand
+by the PlatformManager methods that print them.
+"""
+
+_YUM_TEMPLATE = """
+Install {dependency} on RHEL/CentOS/Fedora:
+
+    sudo {pkg_manager} install -y {pkg}
+
+Note: May require EPEL repository:
+    sudo {pkg_manager} install -y epel-release
+"""
+
+# Missing-dependency instructions by (os_name, variant). The variant is
+# usually the package manager; "-missing" variants are used when the
+# manager has no package for the dependency. Formatted with dependency,
+# os_name, pkg, pkg_manager and apt_pkg.
+INSTRUCTION_TEMPLATES = {
+    ("linux", "apt"): """
+Install {dependency} on Ubuntu/Debian:
+
+    sudo apt update
+    sudo apt install -y {pkg}
+""",
+    ("linux", "apt-missing"): "{dependency} not available via apt. Please install from source.",
+    ("linux", "yum"): _YUM_TEMPLATE,
+    ("linux", "dnf"): _YUM_TEMPLATE,
+    ("linux", "yum-missing"): "{dependency} not available via {pkg_manager}. Install from source.",
+    ("linux", "dnf-missing"): "{dependency} not available via {pkg_manager}. Install from source.",
+    ("linux", "pacman"): """
+Install {dependency} on Arch Linux:
+
+    sudo pacman -S {pkg}
+""",
+    ("linux", "unknown"): """
+{dependency} package manager not detected. Install manually:
+    - Ubuntu/Debian: sudo apt install {dependency}
+    - RHEL/CentOS: sudo yum install {dependency}
+    - Arch: sudo pacman -S {dependency}
+""",
+    ("macos", "brew"): """
+Install {dependency} on macOS:
+
+    brew install {pkg}
+""",
+    ("macos", "brew-missing"): """
+{dependency} is not available via Homebrew.
+Please check the official {dependency} website for macOS installation.
+""",
+    ("macos", "unknown"): """
+Homebrew not found. Install Homebrew first:
+
+    /bin/bash -c "$(curl -fsSL https://raw.githubusercontent.com/Homebrew/install/HEAD/install.sh)"
+
+Then install {dependency}:
+
+    brew install {pkg}
+""",
+    ("windows", "wsl2"): """
+You are in WSL2. Use Linux package manager:
+
+    sudo apt update
+    sudo apt install -y {apt_pkg}
+""",
+    ("windows", "choco"): """
+Install {dependency} on Windows via Chocolatey:
+
+    choco install {pkg} -y
+""",
+    ("windows", "colmap-missing"): """
+COLMAP is not available via Chocolatey on Windows.
+
+Options:
+1. Use WSL2 (recommended for GPU workloads):
+   - Install Ubuntu in WSL2
+   - sudo apt install colmap
+
+2. Use conda:
+   - conda install -c conda-forge colmap
+
+3. Build from source (advanced):
+   - https://colmap.github.io/install.html
+""",
+    ("windows", "unknown"): """
+Install Chocolatey first (run PowerShell as Administrator):
+
+    Set-ExecutionPolicy Bypass -Scope Process -Force
+    [System.Net.ServicePointManager]::SecurityProtocol = [System.Net.ServicePointManager]::SecurityProtocol -bor 3072
+    iex ((New-Object System.Net.WebClient).DownloadString('https://community.chocolatey.org/install.ps1'))
+
+Then install {dependency}:
+
+    choco install {dependency} -y
+""",
+}
+
+INSTRUCTIONS_UNAVAILABLE = "Installation instructions not available for {dependency} on {os_name}"
+
+REC_MACOS = """
+🍎 macOS Detected
+
+Recommendation: Use conda-based installation wizard
+
+Why?
+  • Docker on macOS cannot access NVIDIA GPUs (runs in VM)
+  • Conda-based installation works natively on macOS
+  • All features available except GPU-accelerated processing
+
+Run: python scripts/install_wizard.py
+"""
+
+REC_LINUX_GPU = """
+🐧 Linux + GPU Detected
+
+You have TWO options:
+
+1. Docker-based (Recommended for production)
+   ✓ Isolated, containerized environment
+   ✓ Consistent across systems
+   ✓ Easier troubleshooting and deployment
+   ✗ Slight overhead from containerization
+   → Run: python scripts/install_wizard_docker.py
+
+2. Conda-based (Recommended for development)
+   ✓ Direct filesystem access
+   ✓ More flexible for development/debugging
+   ✓ Lower overhead
+   ✗ More dependencies to manage manually
+   → Run: python scripts/install_wizard.py
+
+Both work great on Linux! Choose based on your workflow.
+"""
+
+REC_WSL2_GPU = """
+🪟 WSL2 + GPU Detected
+
+Recommendation: Docker-based installation
+
+Why?
+  • Excellent GPU support in WSL2 via NVIDIA Container Toolkit
+  • Cleaner separation between Windows and Linux environments
+  • Easier to manage and troubleshoot
+
+Alternative: Conda-based works too if you prefer direct access
+
+Docker: python scripts/install_wizard_docker.py
+Conda: python scripts/install_wizard.py
+"""
+
+REC_NO_GPU = """
+⚠️  No NVIDIA GPU Detected
+
+Recommendation: Conda-based installation
+
+Why?
+  • Motion capture requires NVIDIA GPU (12GB+ VRAM)
+  • Without GPU, only segmentation/roto workflows are available
+  • Conda-based is simpler for CPU-only usage
+
+Run: python scripts/install_wizard.py
+
+Note: If you add a GPU later, you can switch to Docker wizard
+"""
+
+REC_DEFAULT = """
+Choose installation method:
+  • Docker: python scripts/install_wizard_docker.py
+  • Conda: python scripts/install_wizard.py
+"""
@@ -13,7 +13,7 @@ from typing import List, Optional, Tuple
 # Import centralized environment configuration
 from env_config import CONDA_ENV_NAME, PYTHON_VERSION
 
-from .utils import print_error, print_success, print_warning, run_command
+from .utils import PIP_INSTALL, PROBE_TIMEOUT, print_error, print_success, print_warning, run_command
 
 
 def _is_windows() -> bool:
@@ -32,13 +32,13 @@ class CondaEnvironmentManager:
     def detect_conda(self) -> bool:
         """Check if conda is installed and available."""
         # Try conda command directly (works if in PATH)
-        success, output = run_command(["conda", "--version"], check=False, capture=True)
+        success, output = run_command(["conda", "--version"], check=False, capture=True, timeout=PROBE_TIMEOUT)
         if success:
             self.conda_exe = "conda"
             return True
 
         # Try mamba
-        success, output = run_command(["mamba", "--version"], check=False, capture=True)
+        success, output = run_command(["mamba", "--version"], check=False, capture=True, timeout=PROBE_TIMEOUT)
         if success:
             self.conda_exe = "mamba"
             return True
@@ -46,7 +46,7 @@ class CondaEnvironmentManager:
         # Check CONDA_EXE environment variable (set by conda init)
         conda_exe_env = os.environ.get('CONDA_EXE')
         if conda_exe_env and Path(conda_exe_env).exists():
-            success, output = run_command([conda_exe_env, "--version"], check=False, capture=True)
+            success, output = run_command([conda_exe_env, "--version"], check=False, capture=True, timeout=PROBE_TIMEOUT)
             if success:
                 self.conda_exe = conda_exe_env
                 return True
@@ -87,7 +87,7 @@ class CondaEnvironmentManager:
 
         for conda_path in common_paths:
             if conda_path.exists():
-                success, output = run_command([str(conda_path), "--version"], check=False, capture=True)
+                success, output = run_command([str(conda_path), "--version"], check=False, capture=True, timeout=PROBE_TIMEOUT)
                 if success:
                     self.conda_exe = str(conda_path)
                     return True
@@ -115,7 +115,8 @@ class CondaEnvironmentManager:
         success, output = run_command(
             [self.conda_exe, "env", "list"],
             check=False,
-            capture=True
+            capture=True,
+            timeout=PROBE_TIMEOUT
         )
         if not success:
             return []
@@ -182,13 +183,39 @@ class CondaEnvironmentManager:
         success, output = run_command(
             [self.conda_exe, "run", "-n", self.env_name] + where_cmd,
             check=False,
-            capture=True
+            capture=True,
+            timeout=PROBE_TIMEOUT
         )
 
         if success and output.strip():
             return Path(output.strip().split('\n')[0])
         return None
 
+    def get_site_packages(self) -> Optional[Path]:
+        """Locate the environment's site-packages directory without running conda.
+
+        Returns:
+            Path to site-packages, or None if it can't be located
+        """
+        if not self.conda_exe or self.conda_exe == "pip-only":
+            return None
+
+        conda_path = shutil.which(self.conda_exe)
+        if not conda_path:
+            return None
+
+        # <root>/bin/conda (or <root>/Scripts/conda.exe) -> <root>/envs/<name>
+        conda_root = Path(conda_path).resolve().parent.parent
+        for env_dir in (conda_root / "envs" / self.env_name, Path.home() / ".conda" / "envs" / self.env_name):
+            if _is_windows():
+                candidates = [env_dir / "Lib" / "site-packages"]
+            else:
+                candidates = sorted(env_dir.glob("lib/python*/site-packages"))
+            for site_packages in candidates:
+                if site_packages.is_dir():
+                    return site_packages
+        return None
+
     def install_package_conda(self, package: str, channel: Optional[str] = None) -> bool:
         """Install package via conda in the environment.
 
@@ -215,28 +242,45 @@ class CondaEnvironmentManager:
         success, _ = run_command(cmd, timeout=600)
         return success
 
-    def install_package_pip(self, package: str) -> bool:
+    def install_package_pip(self, package: str, extra_args: Optional[List[str]] = None) -> bool:
         """Install package via pip in the environment.
 
         Args:
             package: Package name or pip install spec
+            extra_args: Additional pip arguments (e.g. --index-url)
 
         Returns:
             True if successful
         """
-        if not self.conda_exe:
+        return self.install_packages_pip([package], extra_args)
+
+    def install_packages_pip(self, packages: List[str], extra_args: Optional[List[str]] = None) -> bool:
+        """Install several packages via a single pip invocation.
+
+        One pip run resolves all dependencies together instead of paying
+        pip startup and resolution once per package.
+
+        Args:
+            packages: Package names or pip install specs
+            extra_args: Additional pip arguments (e.g. --index-url)
+
+        Returns:
+            True if successful
+        """
+        if not self.conda_exe or not packages:
             return False
 
-        print(f"  Installing {package} via pip...")
+        print(f"  Installing {' '.join(packages)} via pip...")
+        pip_args = [*PIP_INSTALL, *(extra_args or []), *packages]
 
         # If we're in pip-only mode (active conda env but no conda binary),
         # run pip directly
         if self.conda_exe == "pip-only":
-            success, _ = run_command(["pip", "install", package])
+            success, _ = run_command(["pip", *pip_args])
         else:
             success, _ = run_command([
                 self.conda_exe, "run", "-n", self.env_name,
-                "pip", "install", package
+                "pip", *pip_args
             ])
         return success
 
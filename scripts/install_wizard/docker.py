@@ -422,8 +422,8 @@ class DockerWizard:
         self.checkpoint_downloader = DockerCheckpointDownloader(self.models_dir)
         self.custom_nodes_installer = ComfyUICustomNodesInstaller()
 
-        platform_manager = PlatformManager()
-        self.platform_name, self.environment, _ = platform_manager.detect_platform()
+        ctx = PlatformManager.get_context()
+        self.platform_name, self.environment = ctx.os_name, ctx.environment
 
     def check_system_requirements(self) -> bool:
         """Check all system requirements."""
@@ -7,11 +7,25 @@ including Python packages and Git repositories.
 import shutil
 import sys
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 from env_config import INSTALL_DIR
 
-from .utils import check_python_package, print_error, print_info, print_success, print_warning, run_command
+from .utils import (
+    PIP_INSTALL,
+    PROBE_TIMEOUT,
+    check_command_available,
+    check_python_package,
+    get_package_version,
+    invalidate_check_caches,
+    print_error,
+    print_info,
+    print_success,
+    print_warning,
+    run_command,
+    run_command_async,
+    version_at_least,
+)
 
 if TYPE_CHECKING:
     from .conda import CondaEnvironmentManager
@@ -37,51 +51,159 @@ class ComponentInstaller:
         """Validate installation."""
         return self.check()
 
+    def status_fingerprint(self) -> Optional[Tuple[str, str]]:
+        """Identify this check for the persistent status cache.
+
+        Returns:
+            (key, fingerprint) where a change in fingerprint means check()
+            must run again, or None if check() is cheap enough not to cache
+        """
+        return None
+
 
 class PythonPackageInstaller(ComponentInstaller):
     """Installer for Python packages via pip."""
 
-    def __init__(self, name: str, package: str, import_name: Optional[str] = None, size_gb: float = 0.0):
+    # Extra pip arguments for every install (subclasses or instances may override)
+    EXTRA_PIP_ARGS: List[str] = []
+
+    def __init__(
+        self,
+        name: str,
+        package: str,
+        import_name: Optional[str] = None,
+        size_gb: float = 0.0,
+        pip_args: Optional[List[str]] = None,
+        min_version: Optional[str] = None
+    ):
         super().__init__(name, size_gb)
         self.package = package
         self.import_name = import_name or package
+        self.pip_args = list(self.EXTRA_PIP_ARGS if pip_args is None else pip_args)
+        self.min_version = min_version
         self.conda_manager: Optional['CondaEnvironmentManager'] = None
 
+    @property
+    def pip_spec(self) -> str:
+        """Requirement passed to pip (upgrades packages older than min_version)."""
+        if self.min_version:
+            return f"{self.package}>={self.min_version}"
+        return self.package
+
     def set_conda_manager(self, conda_manager: 'CondaEnvironmentManager'):
         """Set the conda manager for environment-aware installation."""
         self.conda_manager = conda_manager
 
     def check(self) -> bool:
-        """Check if package is installed in the conda environment."""
+        """Check if package is installed (and new enough) in the conda environment."""
         if self.conda_manager and self.conda_manager.conda_exe:
             # Check within the conda environment
+            probe = f"import {self.import_name}"
+            if self.min_version:
+                probe += f"; import importlib.metadata as m; print(m.version({self.package!r}))"
             success, output = run_command([
                 self.conda_manager.conda_exe, "run", "-n", self.conda_manager.env_name,
-                "python", "-c", f"import {self.import_name}"
-            ], check=False, capture=True)
+                "python", "-c", probe
+            ], check=False, capture=True, timeout=PROBE_TIMEOUT)
+            if success and self.min_version:
+                lines = output.strip().splitlines()
+                success = bool(lines) and version_at_least(lines[-1].strip(), self.min_version)
             self.installed = success
         else:
             self.installed = check_python_package(self.package, self.import_name)
+            if self.installed and self.min_version:
+                version = get_package_version(self.package)
+                self.installed = version is not None and version_at_least(version, self.min_version)
         return self.installed
 
+    def validate(self) -> bool:
+        """Validate that the package actually imports, not just that it exists."""
+        if self.conda_manager and self.conda_manager.conda_exe:
+            return self.check()
+        return check_python_package(self.package, self.import_name, deep=True)
+
+    def status_fingerprint(self) -> Optional[Tuple[str, str]]:
+        """Fingerprint the environment's site-packages for the status cache.
+
+        Only the conda check (a `conda run` subprocess) is worth caching; pip
+        adds or removes a directory in site-packages on every install, which
+        changes its mtime.
+        """
+        if not (self.conda_manager and self.conda_manager.conda_exe):
+            return None
+
+        site_packages = self.conda_manager.get_site_packages()
+        if site_packages is None:
+            return None
+        try:
+            mtime = site_packages.stat().st_mtime_ns
+        except OSError:
+            return None
+
+        key = f"pip:{self.conda_manager.env_name}:{self.import_name}"
+        if self.min_version:
+            key += f">={self.min_version}"
+        return key, f"{site_packages}@{mtime}"
+
     def install(self) -> bool:
         print(f"\nInstalling {self.name}...")
 
         # Use conda manager if available to install into the environment
         if self.conda_manager and self.conda_manager.conda_exe:
-            success = self.conda_manager.install_package_pip(self.package)
+            success = self.conda_manager.install_package_pip(self.pip_spec, self.pip_args)
         else:
             # Fallback to system pip (may fail on externally-managed environments)
             print_warning("No conda environment configured, using system pip")
-            success, _ = run_command([sys.executable, "-m", "pip", "install", self.package])
+            success, _ = run_command([
+                sys.executable, "-m", "pip", *PIP_INSTALL, *self.pip_args, self.pip_spec
+            ])
 
         if success:
+            invalidate_check_caches()
             print_success(f"{self.name} installed")
             self.installed = True
         else:
             print_error(f"Failed to install {self.name}")
         return success
 
+    @staticmethod
+    def install_batch(installers: List['PythonPackageInstaller']) -> bool:
+        """Install several packages with one pip invocation.
+
+        Args:
+            installers: Package installers sharing the same environment
+                and pip arguments
+
+        Returns:
+            True if all packages were installed
+        """
+        if len(installers) == 1:
+            return installers[0].install()
+
+        names = ", ".join(installer.name for installer in installers)
+        packages = [installer.pip_spec for installer in installers]
+        print(f"\nInstalling {names}...")
+
+        conda_manager = installers[0].conda_manager
+        pip_args = installers[0].pip_args
+        if conda_manager and conda_manager.conda_exe:
+            success = conda_manager.install_packages_pip(packages, pip_args)
+        else:
+            # Fallback to system pip (may fail on externally-managed environments)
+            print_warning("No conda environment configured, using system pip")
+            success, _ = run_command([
+                sys.executable, "-m", "pip", *PIP_INSTALL, *pip_args, *packages
+            ])
+
+        if success:
+            invalidate_check_caches()
+            for installer in installers:
+                installer.installed = True
+                print_success(f"{installer.name} installed")
+        else:
+            print_error(f"Failed to install {names}")
+        return success
+
 
 class CondaPackageInstaller(ComponentInstaller):
     """Installer for packages via conda (for system tools like COLMAP)."""
@@ -103,12 +225,11 @@ class CondaPackageInstaller(ComponentInstaller):
             success, _ = run_command([
                 self.conda_manager.conda_exe, "run", "-n", self.conda_manager.env_name,
                 self.command, "--version"
-            ], check=False, capture=True)
+            ], check=False, capture=True, timeout=PROBE_TIMEOUT)
             self.installed = success
         else:
             # Check system-wide
-            success, _ = run_command([self.command, "--version"], check=False, capture=True)
-            self.installed = success
+            self.installed = check_command_available(self.command)
         return self.installed
 
     def install(self) -> bool:
@@ -122,6 +243,7 @@ class CondaPackageInstaller(ComponentInstaller):
         success = self.conda_manager.install_package_conda(self.package, self.channel)
 
         if success:
+            invalidate_check_caches()
             print_success(f"{self.name} installed")
             self.installed = True
         else:
@@ -139,9 +261,7 @@ class SystemPackageInstaller(ComponentInstaller):
 
     def check(self) -> bool:
         """Check if command is available system-wide."""
-        import shutil
-        # Use shutil.which() - more reliable than running --version
-        self.installed = shutil.which(self.command) is not None
+        self.installed = check_command_available(self.command)
         return self.installed
 
     def install(self) -> bool:
@@ -153,6 +273,7 @@ class SystemPackageInstaller(ComponentInstaller):
             print_warning("This requires sudo access. You may be prompted for your password.")
             success, _ = run_command(["sudo", "apt-get", "install", "-y", self.apt_package], stream=True)
             if success:
+                invalidate_check_caches()
                 print_success(f"{self.name} installed")
                 self.installed = True
                 return True
@@ -173,32 +294,102 @@ class SystemPackageInstaller(ComponentInstaller):
 class GitRepoInstaller(ComponentInstaller):
     """Installer for Git repositories."""
 
-    def __init__(self, name: str, repo_url: str, install_dir: Optional[Path] = None, size_gb: float = 0.0, extra_packages: list = None):
+    CLONE_JOBS = 4  # Parallel submodule fetches
+    CLONE_TIMEOUT = 3600  # Generous cap so a stalled clone can't hang the wizard forever
+    PREFLIGHT_TIMEOUT = 15  # git ls-remote only exchanges refs
+    INSTALL_SCRIPT_TIMEOUT = 600  # install.py may compile GPU extensions
+
+    def __init__(
+        self,
+        name: str,
+        repo_url: str,
+        install_dir: Optional[Path] = None,
+        size_gb: float = 0.0,
+        extra_packages: list = None,
+        full_history: bool = False,
+        branch: Optional[str] = None,
+    ):
         super().__init__(name, size_gb)
         self.repo_url = repo_url
         self.install_dir = install_dir or INSTALL_DIR / name.lower()
         self.conda_manager: Optional['CondaEnvironmentManager'] = None
         self.extra_packages = extra_packages or []
+        self.full_history = full_history  # Shallow clone unless history is needed (e.g. repos janitor.py pulls)
+        self.branch = branch  # Default branch if None
 
     def set_conda_manager(self, conda_manager: 'CondaEnvironmentManager'):
         """Set the conda manager for environment-aware installation."""
         self.conda_manager = conda_manager
 
     def check(self) -> bool:
-        self.installed = self.install_dir.exists() and (self.install_dir / ".git").exists()
+        self.installed = self.is_cloned()
         return self.installed
 
+    def is_cloned(self) -> bool:
+        """Check if the repository has been cloned."""
+        # A single stat; .git may be a file for worktrees and submodules
+        return (self.install_dir / ".git").exists()
+
+    def _clone_cmd(self) -> list:
+        cmd = ["git", "clone", "--recurse-submodules", f"--jobs={self.CLONE_JOBS}"]
+        if not self.full_history:
+            cmd += ["--depth=1", "--filter=blob:none", "--single-branch", "--shallow-submodules"]
+        if self.branch:
+            cmd += ["--branch", self.branch]
+        return cmd + [self.repo_url, str(self.install_dir)]
+
+    def _discard_partial_clone(self, existed: bool):
+        """Remove what a failed or killed clone left behind.
+
+        A clone killed on timeout leaves a .git directory that is_cloned()
+        would take for a finished checkout. Nothing is removed if the
+        directory was already there before the clone started.
+        """
+        if not existed:
+            shutil.rmtree(self.install_dir, ignore_errors=True)
+
+    def preflight(self) -> bool:
+        """Check that the repository URL is reachable without cloning it."""
+        success, _ = run_command(
+            ["git", "ls-remote", "--exit-code", self.repo_url, "HEAD"],
+            check=False, capture=True, timeout=self.PREFLIGHT_TIMEOUT
+        )
+        return success
+
+    async def clone_async(self) -> bool:
+        """Clone the repository without installing dependencies.
+
+        Used to fetch several repositories concurrently ahead of the serial
+        install pass; install() skips the clone when it has already happened.
+        """
+        self.install_dir.parent.mkdir(parents=True, exist_ok=True)
+        existed = self.install_dir.exists()
+        success, output = await run_command_async(self._clone_cmd(), timeout=self.CLONE_TIMEOUT)
+        if success:
+            print_success(f"Cloned {self.name}")
+        else:
+            self._discard_partial_clone(existed)
+            print_warning(f"Failed to clone {self.name}, will retry during install")
+            if output:
+                print(f"    {output.strip().splitlines()[-1]}")
+        return success
+
     def install(self) -> bool:
         print(f"\nInstalling {self.name} from {self.repo_url}...")
 
         # Create parent directory
         self.install_dir.parent.mkdir(parents=True, exist_ok=True)
 
-        # Clone repository
-        success, _ = run_command(["git", "clone", self.repo_url, str(self.install_dir)])
-        if not success:
-            print_error(f"Failed to clone {self.name}")
-            return False
+        # Clone repository (may already have been fetched by clone_async)
+        if self.is_cloned():
+            print_info(f"  {self.name} already cloned")
+        else:
+            existed = self.install_dir.exists()
+            success, _ = run_command(self._clone_cmd(), timeout=self.CLONE_TIMEOUT)
+            if not success:
+                self._discard_partial_clone(existed)
+                print_error(f"Failed to clone {self.name}")
+                return False
 
         # Install dependencies from requirements.txt if exists
         requirements_txt = self.install_dir / "requirements.txt"
@@ -207,12 +398,12 @@ class GitRepoInstaller(ComponentInstaller):
             if self.conda_manager and self.conda_manager.conda_exe:
                 success, _ = run_command([
                     self.conda_manager.conda_exe, "run", "-n", self.conda_manager.env_name,
-                    "pip", "install", "-r", str(requirements_txt)
+                    "pip", *PIP_INSTALL, "-r", str(requirements_txt)
                 ])
             else:
                 print_warning("No conda environment configured, using system pip")
                 success, _ = run_command(
-                    [sys.executable, "-m", "pip", "install", "-r", str(requirements_txt)]
+                    [sys.executable, "-m", "pip", *PIP_INSTALL, "-r", str(requirements_txt)]
                 )
             if not success:
                 print_warning(f"requirements.txt install failed for {self.name}")
@@ -225,12 +416,12 @@ class GitRepoInstaller(ComponentInstaller):
             if self.conda_manager and self.conda_manager.conda_exe:
                 success, _ = run_command([
                     self.conda_manager.conda_exe, "run", "-n", self.conda_manager.env_name,
-                    "pip", "install", "-e", str(self.install_dir)
+                    "pip", *PIP_INSTALL, "-e", str(self.install_dir)
                 ])
             else:
                 print_warning("No conda environment configured, using system pip")
                 success, _ = run_command(
-                    [sys.executable, "-m", "pip", "install", "-e", str(self.install_dir)]
+                    [sys.executable, "-m", "pip", *PIP_INSTALL, "-e", str(self.install_dir)]
                 )
             if not success:
                 print_warning(f"pip install failed for {self.name}")
@@ -242,10 +433,10 @@ class GitRepoInstaller(ComponentInstaller):
                 if self.conda_manager and self.conda_manager.conda_exe:
                     success, _ = run_command([
                         self.conda_manager.conda_exe, "run", "-n", self.conda_manager.env_name,
-                        "pip", "install", pkg
+                        "pip", *PIP_INSTALL, pkg
                     ])
                 else:
-                    success, _ = run_command([sys.executable, "-m", "pip", "install", pkg])
+                    success, _ = run_command([sys.executable, "-m", "pip", *PIP_INSTALL, pkg])
                 if not success:
                     print_warning(f"Failed to install {pkg}")
 
@@ -257,16 +448,18 @@ class GitRepoInstaller(ComponentInstaller):
                 success, output = run_command([
                     self.conda_manager.conda_exe, "run", "-n", self.conda_manager.env_name,
                     "python", str(install_py)
-                ], capture=True)
+                ], capture=True, timeout=self.INSTALL_SCRIPT_TIMEOUT)
             else:
                 success, output = run_command(
-                    [sys.executable, str(install_py)], capture=True
+                    [sys.executable, str(install_py)], capture=True,
+                    timeout=self.INSTALL_SCRIPT_TIMEOUT
                 )
             if success:
                 print_success(f"{self.name} install script completed")
             else:
                 print_warning(f"install.py failed for {self.name} (GPU acceleration may be slower)")
 
+        invalidate_check_caches()
         self.installed = True
         print_success(f"{self.name} cloned to {self.install_dir}")
         return True
@@ -407,11 +600,11 @@ class GSIRInstaller(ComponentInstaller):
                 return False
 
         print("  Installing kornia...")
-        if not self._run_pip(["install", "kornia"]):
+        if not self._run_pip([*PIP_INSTALL, "kornia"]):
             print_warning("Failed to install kornia")
 
         print("  Installing nvdiffrast...")
-        if not self._run_pip(["install", "--no-build-isolation", "git+https://github.com/NVlabs/nvdiffrast.git"]):
+        if not self._run_pip([*PIP_INSTALL, "--no-build-isolation", "git+https://github.com/NVlabs/nvdiffrast.git"]):
             print_warning("Failed to install nvdiffrast")
 
         if not shutil.which("nvcc"):
@@ -423,7 +616,7 @@ class GSIRInstaller(ComponentInstaller):
 
         print("  Building diff-gaussian-rasterization...")
         if diff_gauss.exists():
-            if not self._run_pip(["install", "--no-build-isolation", str(diff_gauss)]):
+            if not self._run_pip([*PIP_INSTALL, "--no-build-isolation", str(diff_gauss)]):
                 print_error("Failed to build diff-gaussian-rasterization")
                 return False
         else:
@@ -432,7 +625,7 @@ class GSIRInstaller(ComponentInstaller):
 
         print("  Building simple-knn...")
         if simple_knn.exists():
-            if not self._run_pip(["install", "--no-build-isolation", str(simple_knn)]):
+            if not self._run_pip([*PIP_INSTALL, "--no-build-isolation", str(simple_knn)]):
                 print_error("Failed to build simple-knn")
                 return False
         else:
@@ -442,11 +635,12 @@ class GSIRInstaller(ComponentInstaller):
         gsir_module = self.install_dir / "gs-ir"
         print("  Installing gs-ir module...")
         if gsir_module.exists():
-            if not self._run_pip(["install", "-e", str(gsir_module)]):
+            if not self._run_pip([*PIP_INSTALL, "-e", str(gsir_module)]):
                 print_warning("Failed to install gs-ir module (may work without it)")
         else:
             print_warning("gs-ir module directory not found")
 
+        invalidate_check_caches()
         self.installed = True
         print_success(f"GS-IR installed to {self.install_dir}")
         return True
@@ -4,11 +4,14 @@ Provides platform detection and OS-specific installation instructions
 for system dependencies across Linux, macOS, Windows, and WSL2.
 """
 
+import functools
 import os
 import platform
+import re
 import shutil
 import subprocess
 import sys
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -17,19 +20,94 @@ from env_config import INSTALL_DIR
 # Repo-local tools directory (sandboxed, no home directory pollution)
 TOOLS_DIR = INSTALL_DIR / "tools"
 
+# WSL kernels mention Microsoft or WSL in /proc/version
+_WSL_RE = re.compile(rb"microsoft|wsl", re.IGNORECASE)
+
+# Results of PlatformManager.find_tool (None for tools found missing)
+_find_tool_cache: Dict[str, Optional[Path]] = {}
+
+# System package install commands by (os_name, package manager)
+_INSTALL_COMMANDS: Dict[Tuple[str, str], str] = {
+    ("linux", "apt"): "sudo apt update && sudo apt install -y {package}",
+    ("linux", "yum"): "sudo yum install -y {package}",
+    ("linux", "dnf"): "sudo dnf install -y {package}",
+    ("linux", "pacman"): "sudo pacman -S {package}",
+    ("linux", "zypper"): "sudo zypper install {package}",
+    ("macos", "brew"): "brew install {package}",
+    ("windows", "winget"): "winget install {package}",
+    ("windows", "choco"): "choco install {package} -y",
+    ("windows", "scoop"): "scoop install {package}",
+}
+
+# Package names of system dependencies by package manager
+_DEPENDENCY_PACKAGES: Dict[str, Dict[str, Optional[str]]] = {
+    "ffmpeg": {
+        "apt": "ffmpeg",
+        "yum": "ffmpeg",
+        "dnf": "ffmpeg",
+        "brew": "ffmpeg",
+        "choco": "ffmpeg",
+    },
+    "git": {
+        "apt": "git",
+        "yum": "git",
+        "dnf": "git",
+        "brew": "git",
+        "choco": "git",
+    },
+    "colmap": {
+        "apt": "colmap",
+        "yum": "colmap",  # May need EPEL
+        "dnf": "colmap",
+        "brew": "colmap",
+        "choco": None,  # Not available
+    },
+}
+
 
 def _is_windows() -> bool:
     """Check if running on Windows."""
     return sys.platform == "win32"
 
 
+@functools.lru_cache(maxsize=1)
+def _is_wsl2() -> bool:
+    """Check if running under WSL2 (read /proc/version once)."""
+    if not sys.platform.startswith("linux"):
+        return False
+    # The kernel banner is one short line; read its start as raw bytes
+    try:
+        fd = os.open("/proc/version", os.O_RDONLY)
+        try:
+            version_info = os.read(fd, 256)
+        finally:
+            os.close(fd)
+    except OSError:
+        return False
+    return _WSL_RE.search(version_info) is not None
+
+
+@dataclass(frozen=True, slots=True)
+class PlatformContext:
+    """Platform facts that don't change while the process runs."""
+    os_name: str
+    environment: str
+    pkg_manager: str
+    is_wsl2: bool
+    has_nvidia_smi: bool
+
+
 class PlatformManager:
     """Handles platform detection and OS-specific instructions."""
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def detect_platform() -> Tuple[str, str, str]:
         """Detect operating system and package manager.
 
+        The platform can't change while the process runs, so the result is
+        computed once and cached.
+
         Returns:
             Tuple of (os_name, environment, package_manager) where:
             - os_name: 'linux', 'macos', 'windows'
@@ -39,14 +117,8 @@ class PlatformManager:
         system = platform.system().lower()
 
         if system == "linux":
-            try:
-                with open("/proc/version", "r") as f:
-                    version_info = f.read().lower()
-                    if "microsoft" in version_info or "wsl" in version_info:
-                        return "linux", "wsl2", PlatformManager._detect_linux_package_manager()
-            except FileNotFoundError:
-                pass
-            return "linux", "native", PlatformManager._detect_linux_package_manager()
+            environment = "wsl2" if _is_wsl2() else "native"
+            return "linux", environment, PlatformManager._detect_linux_package_manager()
 
         elif system == "darwin":
             has_brew = shutil.which("brew") is not None
@@ -58,27 +130,47 @@ class PlatformManager:
 
         return system, "unknown", "unknown"
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def get_context() -> PlatformContext:
+        """Get platform, WSL2 and nvidia-smi detection in one cached call.
+
+        Returns:
+            PlatformContext computed on first use
+        """
+        os_name, environment, pkg_manager = PlatformManager.detect_platform()
+        return PlatformContext(
+            os_name=os_name,
+            environment=environment,
+            pkg_manager=pkg_manager,
+            is_wsl2=_is_wsl2(),
+            has_nvidia_smi=PlatformManager.find_tool("nvidia-smi") is not None,
+        )
+
+    @staticmethod
+    def is_wsl2() -> bool:
+        """Check if running under WSL2.
+
+        Returns:
+            True if the Linux kernel reports a Microsoft/WSL build
+        """
+        return _is_wsl2()
+
     @staticmethod
     def _detect_linux_package_manager() -> str:
-        """Detect Linux package manager."""
+        """Detect Linux package manager by looking for its binary on PATH."""
         managers = [
-            ("apt", ["apt", "--version"]),
-            ("apt-get", ["apt-get", "--version"]),
-            ("yum", ["yum", "--version"]),
-            ("dnf", ["dnf", "--version"]),
-            ("pacman", ["pacman", "--version"]),
-            ("zypper", ["zypper", "--version"]),
+            ("apt", "apt"),
+            ("apt", "apt-get"),
+            ("yum", "yum"),
+            ("dnf", "dnf"),
+            ("pacman", "pacman"),
+            ("zypper", "zypper"),
         ]
 
-        for name, cmd in managers:
-            try:
-                result = subprocess.run(cmd, capture_output=True, timeout=2)
-                if result.returncode == 0:
-                    if name == "apt-get":
-                        return "apt"
-                    return name
-            except (FileNotFoundError, subprocess.TimeoutExpired):
-                continue
+        for name, binary in managers:
+            if shutil.which(binary):
+                return name
 
         return "unknown"
 
@@ -102,16 +194,43 @@ class PlatformManager:
         2. System PATH
         3. Platform-specific standard locations
 
+        Results (including misses) are cached; call invalidate_tool_cache()
+        after installing or removing tools.
+
         Args:
             tool_name: Name of the tool (e.g., 'colmap', 'ffmpeg', '7z')
 
         Returns:
             Path to the executable if found, None otherwise.
         """
+        if tool_name in _find_tool_cache:
+            return _find_tool_cache[tool_name]
+
+        path = PlatformManager._search_tool(tool_name)
+        _find_tool_cache[tool_name] = path
+        return path
+
+    @staticmethod
+    def invalidate_tool_cache(tool_name: Optional[str] = None) -> None:
+        """Forget find_tool results.
+
+        Args:
+            tool_name: Tool to forget, or None to forget all tools
+        """
+        if tool_name is None:
+            _find_tool_cache.clear()
+        else:
+            _find_tool_cache.pop(tool_name, None)
+
+    @staticmethod
+    def _search_tool(tool_name: str) -> Optional[Path]:
+        """Search the filesystem for a tool (uncached find_tool)."""
         # 1. Check repo-local tools directory FIRST (sandboxed)
+        # os.path.isfile: one stat with less overhead than Path.exists, and
+        # a directory that happens to share the tool's name doesn't match
         local_paths = PlatformManager._get_local_tool_paths(tool_name)
         for path in local_paths:
-            if path.exists():
+            if os.path.isfile(path):
                 return path
 
         # 2. Check system PATH
@@ -126,7 +245,7 @@ class PlatformManager:
             search_paths = PlatformManager._get_unix_tool_paths(tool_name)
 
         for path in search_paths:
-            if path.exists():
+            if os.path.isfile(path):
                 return path
 
         return None
@@ -149,8 +268,12 @@ class PlatformManager:
                 tool_dir / "bin" / tool_name,
             ]
 
+    # System-wide candidate tables, built once per tool name (lru_cache) and
+    # returned as tuples so no caller can alter the cached value
+
     @staticmethod
-    def _get_windows_tool_paths(tool_name: str) -> List[Path]:
+    @functools.lru_cache(maxsize=None)
+    def _get_windows_tool_paths(tool_name: str) -> Tuple[Path, ...]:
         """Get Windows system-wide search paths for a tool.
 
         NOTE: Only searches system directories (Program Files, etc.).
@@ -159,6 +282,10 @@ class PlatformManager:
         """
         programfiles = Path(os.environ.get("PROGRAMFILES", "C:/Program Files"))
         programfiles_x86 = Path(os.environ.get("PROGRAMFILES(X86)", "C:/Program Files (x86)"))
+        # Shared parent directories, built once and reused by several entries
+        ffmpeg_bins = (programfiles / "FFmpeg" / "bin", programfiles_x86 / "FFmpeg" / "bin",
+                       Path("C:/ffmpeg/bin"))
+        cuda_root = programfiles / "NVIDIA GPU Computing Toolkit" / "CUDA"
 
         tool_paths: Dict[str, List[Path]] = {
             "colmap": [
@@ -166,16 +293,8 @@ class PlatformManager:
                 programfiles_x86 / "COLMAP" / "COLMAP.bat",
                 Path("C:/COLMAP/COLMAP.bat"),
             ],
-            "ffmpeg": [
-                programfiles / "FFmpeg" / "bin" / "ffmpeg.exe",
-                programfiles_x86 / "FFmpeg" / "bin" / "ffmpeg.exe",
-                Path("C:/ffmpeg/bin/ffmpeg.exe"),
-            ],
-            "ffprobe": [
-                programfiles / "FFmpeg" / "bin" / "ffprobe.exe",
-                programfiles_x86 / "FFmpeg" / "bin" / "ffprobe.exe",
-                Path("C:/ffmpeg/bin/ffprobe.exe"),
-            ],
+            "ffmpeg": [bin_dir / "ffmpeg.exe" for bin_dir in ffmpeg_bins],
+            "ffprobe": [bin_dir / "ffprobe.exe" for bin_dir in ffmpeg_bins],
             "7z": [
                 programfiles / "7-Zip" / "7z.exe",
                 programfiles_x86 / "7-Zip" / "7z.exe",
@@ -185,19 +304,18 @@ class PlatformManager:
                 Path("C:/Windows/System32/nvidia-smi.exe"),
             ],
             "nvcc": [
-                programfiles / "NVIDIA GPU Computing Toolkit" / "CUDA" / "v12.1" / "bin" / "nvcc.exe",
-                programfiles / "NVIDIA GPU Computing Toolkit" / "CUDA" / "v12.0" / "bin" / "nvcc.exe",
-                programfiles / "NVIDIA GPU Computing Toolkit" / "CUDA" / "v11.8" / "bin" / "nvcc.exe",
-                programfiles / "NVIDIA GPU Computing Toolkit" / "CUDA" / "v11.7" / "bin" / "nvcc.exe",
+                *(cuda_root / version / "bin" / "nvcc.exe"
+                  for version in ("v12.1", "v12.0", "v11.8", "v11.7")),
                 Path("C:/CUDA/bin/nvcc.exe"),
             ],
             "aria2c": [],
         }
 
-        return tool_paths.get(tool_name, [])
+        return tuple(tool_paths.get(tool_name, ()))
 
     @staticmethod
-    def _get_unix_tool_paths(tool_name: str) -> List[Path]:
+    @functools.lru_cache(maxsize=None)
+    def _get_unix_tool_paths(tool_name: str) -> Tuple[Path, ...]:
         """Get Unix system-wide search paths for a tool.
 
         NOTE: Only searches system directories (/usr/bin, /usr/local/bin).
@@ -228,12 +346,13 @@ class PlatformManager:
             ],
         }
 
-        return tool_paths.get(tool_name, [])
+        return tuple(tool_paths.get(tool_name, ()))
 
     @staticmethod
     def run_tool(
         tool_path: Path,
         args: List[str],
+        replace_process: bool = False,
         **subprocess_kwargs
     ) -> subprocess.CompletedProcess:
         """Run an external tool with proper handling for Windows .bat files.
@@ -243,6 +362,9 @@ class PlatformManager:
         Args:
             tool_path: Path to the tool executable
             args: Arguments to pass to the tool
+            replace_process: Replace the current process with the tool instead
+                of spawning a child (POSIX only; the call then never returns).
+                For callers whose last action is running the tool.
             **subprocess_kwargs: Additional args for subprocess.run
 
         Returns:
@@ -250,6 +372,12 @@ class PlatformManager:
         """
         cmd = [str(tool_path)] + args
 
+        if replace_process and not _is_windows():
+            # Flush our buffered output before the process image is replaced
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.execv(cmd[0], cmd)
+
         if _is_windows() and str(tool_path).lower().endswith('.bat'):
             subprocess_kwargs['shell'] = True
 
@@ -271,19 +399,8 @@ class PlatformManager:
         Returns:
             Installation command string or None if not available
         """
-        commands = {
-            ("linux", "apt"): f"sudo apt update && sudo apt install -y {package}",
-            ("linux", "yum"): f"sudo yum install -y {package}",
-            ("linux", "dnf"): f"sudo dnf install -y {package}",
-            ("linux", "pacman"): f"sudo pacman -S {package}",
-            ("linux", "zypper"): f"sudo zypper install {package}",
-            ("macos", "brew"): f"brew install {package}",
-            ("windows", "winget"): f"winget install {package}",
-            ("windows", "choco"): f"choco install {package} -y",
-            ("windows", "scoop"): f"scoop install {package}",
-        }
-
-        return commands.get((os_name, pkg_manager))
+        template = _INSTALL_COMMANDS.get((os_name, pkg_manager))
+        return template.format(package=package) if template else None
 
     @staticmethod
     def get_missing_dependency_instructions(
@@ -303,140 +420,33 @@ class PlatformManager:
         Returns:
             Multi-line installation instructions
         """
-        pkg_map = {
-            "ffmpeg": {
-                "apt": "ffmpeg",
-                "yum": "ffmpeg",
-                "dnf": "ffmpeg",
-                "brew": "ffmpeg",
-                "choco": "ffmpeg",
-            },
-            "git": {
-                "apt": "git",
-                "yum": "git",
-                "dnf": "git",
-                "brew": "git",
-                "choco": "git",
-            },
-            "colmap": {
-                "apt": "colmap",
-                "yum": "colmap",  # May need EPEL
-                "dnf": "colmap",
-                "brew": "colmap",
-                "choco": None,  # Not available
-            },
-        }
-
-        package_name = pkg_map.get(dependency, {}).get(pkg_manager)
-
-        if os_name == "linux":
-            if pkg_manager == "apt":
-                if package_name:
-                    return f"""
-Install {dependency} on Ubuntu/Debian:
-
-    sudo apt update
-    sudo apt install -y {package_name}
-"""
-                else:
-                    return f"{dependency} not available via apt. Please install from source."
-
-            elif pkg_manager in ("yum", "dnf"):
-                if package_name:
-                    return f"""
-Install {dependency} on RHEL/CentOS/Fedora:
-
-    sudo {pkg_manager} install -y {package_name}
-
-Note: May require EPEL repository:
-    sudo {pkg_manager} install -y epel-release
-"""
-                else:
-                    return f"{dependency} not available via {pkg_manager}. Install from source."
-
-            elif pkg_manager == "pacman":
-                return f"""
-Install {dependency} on Arch Linux:
-
-    sudo pacman -S {package_name or dependency}
-"""
-            else:
-                return f"""
-{dependency} package manager not detected. Install manually:
-    - Ubuntu/Debian: sudo apt install {dependency}
-    - RHEL/CentOS: sudo yum install {dependency}
-    - Arch: sudo pacman -S {dependency}
-"""
-
-        elif os_name == "macos":
-            if pkg_manager == "brew":
-                if package_name:
-                    return f"""
-Install {dependency} on macOS:
-
-    brew install {package_name}
-"""
-                else:
-                    return f"""
-{dependency} is not available via Homebrew.
-Please check the official {dependency} website for macOS installation.
-"""
-            else:
-                return f"""
-Homebrew not found. Install Homebrew first:
-
-    /bin/bash -c "$(curl -fsSL https://raw.githubusercontent.com/Homebrew/install/HEAD/install.sh)"
+        from ._messages import INSTRUCTION_TEMPLATES, INSTRUCTIONS_UNAVAILABLE
 
-Then install {dependency}:
+        packages = _DEPENDENCY_PACKAGES.get(dependency, {})
+        package_name = packages.get(pkg_manager)
 
-    brew install {package_name or dependency}
-"""
-
-        elif os_name == "windows":
+        if os_name == "windows":
             if environment == "wsl2":
-                return f"""
-You are in WSL2. Use Linux package manager:
-
-    sudo apt update
-    sudo apt install -y {pkg_map.get(dependency, {}).get('apt', dependency)}
-"""
+                variant = "wsl2"
+            elif pkg_manager == "choco" and package_name:
+                variant = "choco"
             else:
-                if pkg_manager == "choco" and package_name:
-                    return f"""
-Install {dependency} on Windows via Chocolatey:
-
-    choco install {package_name} -y
-"""
-                else:
-                    if dependency == "colmap":
-                        return """
-COLMAP is not available via Chocolatey on Windows.
-
-Options:
-1. Use WSL2 (recommended for GPU workloads):
-   - Install Ubuntu in WSL2
-   - sudo apt install colmap
-
-2. Use conda:
-   - conda install -c conda-forge colmap
-
-3. Build from source (advanced):
-   - https://colmap.github.io/install.html
-"""
-                    else:
-                        return f"""
-Install Chocolatey first (run PowerShell as Administrator):
-
-    Set-ExecutionPolicy Bypass -Scope Process -Force
-    [System.Net.ServicePointManager]::SecurityProtocol = [System.Net.ServicePointManager]::SecurityProtocol -bor 3072
-    iex ((New-Object System.Net.WebClient).DownloadString('https://community.chocolatey.org/install.ps1'))
-
-Then install {dependency}:
-
-    choco install {dependency} -y
-"""
+                variant = "colmap-missing" if dependency == "colmap" else "unknown"
+        elif (os_name, pkg_manager) in INSTRUCTION_TEMPLATES:
+            variant = pkg_manager
+            if not package_name and (os_name, f"{pkg_manager}-missing") in INSTRUCTION_TEMPLATES:
+                variant = f"{pkg_manager}-missing"
+        else:
+            variant = "unknown"
 
-        return f"Installation instructions not available for {dependency} on {os_name}"
+        template = INSTRUCTION_TEMPLATES.get((os_name, variant), INSTRUCTIONS_UNAVAILABLE)
+        return template.format(
+            dependency=dependency,
+            os_name=os_name,
+            pkg=package_name or dependency,
+            pkg_manager=pkg_manager,
+            apt_pkg=packages.get("apt", dependency),
+        )
 
     @staticmethod
     def get_wizard_recommendation(
@@ -454,82 +464,23 @@ Then install {dependency}:
         Returns:
             Recommendation text
         """
-        if os_name == "macos":
-            return """
-🍎 macOS Detected
-
-Recommendation: Use conda-based installation wizard
-
-Why?
-  • Docker on macOS cannot access NVIDIA GPUs (runs in VM)
-  • Conda-based installation works natively on macOS
-  • All features available except GPU-accelerated processing
-
-Run: python scripts/install_wizard.py
-"""
+        from ._messages import (
+            REC_DEFAULT,
+            REC_LINUX_GPU,
+            REC_MACOS,
+            REC_NO_GPU,
+            REC_WSL2_GPU,
+        )
 
+        if os_name == "macos":
+            return REC_MACOS
         elif os_name == "linux" and environment == "native" and has_gpu:
-            return """
-🐧 Linux + GPU Detected
-
-You have TWO options:
-
-1. Docker-based (Recommended for production)
-   ✓ Isolated, containerized environment
-   ✓ Consistent across systems
-   ✓ Easier troubleshooting and deployment
-   ✗ Slight overhead from containerization
-   → Run: python scripts/install_wizard_docker.py
-
-2. Conda-based (Recommended for development)
-   ✓ Direct filesystem access
-   ✓ More flexible for development/debugging
-   ✓ Lower overhead
-   ✗ More dependencies to manage manually
-   → Run: python scripts/install_wizard.py
-
-Both work great on Linux! Choose based on your workflow.
-"""
-
+            return REC_LINUX_GPU
         elif os_name == "linux" and environment == "wsl2" and has_gpu:
-            return """
-🪟 WSL2 + GPU Detected
-
-Recommendation: Docker-based installation
-
-Why?
-  • Excellent GPU support in WSL2 via NVIDIA Container Toolkit
-  • Cleaner separation between Windows and Linux environments
-  • Easier to manage and troubleshoot
-
-Alternative: Conda-based works too if you prefer direct access
-
-Docker: python scripts/install_wizard_docker.py
-Conda: python scripts/install_wizard.py
-"""
-
+            return REC_WSL2_GPU
         elif not has_gpu:
-            return """
-⚠️  No NVIDIA GPU Detected
-
-Recommendation: Conda-based installation
-
-Why?
-  • Motion capture requires NVIDIA GPU (12GB+ VRAM)
-  • Without GPU, only segmentation/roto workflows are available
-  • Conda-based is simpler for CPU-only usage
-
-Run: python scripts/install_wizard.py
-
-Note: If you add a GPU later, you can switch to Docker wizard
-"""
-
-        else:
-            return """
-Choose installation method:
-  • Docker: python scripts/install_wizard_docker.py
-  • Conda: python scripts/install_wizard.py
-"""
+            return REC_NO_GPU
+        return REC_DEFAULT
 
     # =========================================================================
     # SANDBOXED TOOL INSTALLATION
@@ -622,6 +573,8 @@ Choose installation method:
 
             PlatformManager._flatten_single_subdir(tool_dir)
 
+            # The new local copy takes priority over anything found before
+            PlatformManager.invalidate_tool_cache(tool_name)
             installed_path = PlatformManager.find_tool(tool_name)
             if installed_path:
                 print(f"    Successfully installed {tool_name} at {installed_path}")
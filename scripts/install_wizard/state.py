@@ -7,7 +7,7 @@ allowing interrupted installations to be resumed.
 import json
 import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from env_config import INSTALL_DIR
 
@@ -45,7 +45,8 @@ class InstallationStateManager:
             "environment": None,
             "last_updated": None,
             "components": {},
-            "checkpoints": {}
+            "checkpoints": {},
+            "checks": {}
         }
 
     def save_state(self):
@@ -135,6 +136,27 @@ class InstallationStateManager:
         """Check if checkpoint is already downloaded."""
         return self.state["checkpoints"].get(comp_id, {}).get("downloaded", False)
 
+    def get_cached_check(self, key: str, fingerprint: str) -> Optional[bool]:
+        """Get a cached installer check result.
+
+        Returns:
+            Cached result, or None if missing or the fingerprint changed
+        """
+        entry = self.state["checks"].get(key)
+        if not entry or entry.get("fingerprint") != fingerprint:
+            return None
+        return entry.get("installed")
+
+    def cache_checks(self, results: Dict[str, Tuple[str, bool]]):
+        """Store installer check results.
+
+        Args:
+            results: Mapping of key to (fingerprint, installed)
+        """
+        for key, (fingerprint, installed) in results.items():
+            self.state["checks"][key] = {"fingerprint": fingerprint, "installed": installed}
+        self.save_state()
+
     def clear_state(self):
         """Clear installation state (for fresh start)."""
         self.state = self._create_initial_state()
@@ -4,15 +4,43 @@ This module provides terminal output formatting, user input helpers,
 and system check utilities used throughout the wizard.
 """
 
+import asyncio
+import collections
+import functools
+import importlib
+import importlib.metadata
+import importlib.util
+import os
 import shutil
 import subprocess
 import sys
+import threading
+import time
 from pathlib import Path
 from typing import List, Optional, Tuple
 
+from .platform import PlatformManager
+
 # Global TTY file handle for reading input when piped (Unix only)
 _tty_handle = None
 
+# Non-interactive pip install: never prompt, skip the PyPI self-version check,
+# and take a wheel over building an sdist whenever one exists
+PIP_INSTALL = ["install", "--no-input", "--disable-pip-version-check", "--prefer-binary"]
+
+# Lines of streamed output kept for the caller (enough for an error trace)
+STREAM_TAIL_LINES = 200
+
+# Default limit for captured commands (fetches and build scripts run captured
+# too); visible installs run unbounded
+CAPTURE_TIMEOUT = 600
+
+# Limit that quick probes (--version, import checks) pass explicitly
+PROBE_TIMEOUT = 120
+
+# Seconds between "still running" notices for long visible commands
+HEARTBEAT_INTERVAL = 30
+
 
 def _is_windows() -> bool:
     """Check if running on Windows."""
@@ -66,44 +94,63 @@ def tty_input(prompt: str = "") -> str:
         return _tty_handle.readline().rstrip('\n')
 
 
+def _use_color() -> bool:
+    """Color only interactive output, and respect NO_COLOR (https://no-color.org)."""
+    if "NO_COLOR" in os.environ:
+        return False
+    try:
+        return sys.stdout.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
 class Colors:
-    """Terminal colors for pretty output."""
-    HEADER = '\033[95m'
-    OKBLUE = '\033[94m'
-    OKCYAN = '\033[96m'
-    OKGREEN = '\033[92m'
-    WARNING = '\033[93m'
-    FAIL = '\033[91m'
-    ENDC = '\033[0m'
-    BOLD = '\033[1m'
-    UNDERLINE = '\033[4m'
+    """Terminal colors for pretty output (empty when color is disabled)."""
+    _ENABLED = _use_color()
+    HEADER = '\033[95m' if _ENABLED else ''
+    OKBLUE = '\033[94m' if _ENABLED else ''
+    OKCYAN = '\033[96m' if _ENABLED else ''
+    OKGREEN = '\033[92m' if _ENABLED else ''
+    WARNING = '\033[93m' if _ENABLED else ''
+    FAIL = '\033[91m' if _ENABLED else ''
+    ENDC = '\033[0m' if _ENABLED else ''
+    BOLD = '\033[1m' if _ENABLED else ''
+    UNDERLINE = '\033[4m' if _ENABLED else ''
+
+
+# Pre-built message decorations
+_HEADER_BAR = f"{Colors.HEADER}{Colors.BOLD}{'=' * 60}{Colors.ENDC}"
+_HEADER_PREFIX = f"{Colors.HEADER}{Colors.BOLD}"
+_SUCCESS_PREFIX = f"{Colors.OKGREEN}✓ "
+_WARNING_PREFIX = f"{Colors.WARNING}⚠ "
+_ERROR_PREFIX = f"{Colors.FAIL}✗ "
+_INFO_PREFIX = f"{Colors.OKCYAN}ℹ "
+_RESET = Colors.ENDC
 
 
 def print_header(text: str):
     """Print section header."""
-    print(f"\n{Colors.HEADER}{Colors.BOLD}{'='*60}{Colors.ENDC}")
-    print(f"{Colors.HEADER}{Colors.BOLD}{text}{Colors.ENDC}")
-    print(f"{Colors.HEADER}{Colors.BOLD}{'='*60}{Colors.ENDC}\n")
+    print(f"\n{_HEADER_BAR}\n{_HEADER_PREFIX}{text}{_RESET}\n{_HEADER_BAR}\n")
 
 
 def print_success(text: str):
     """Print success message."""
-    print(f"{Colors.OKGREEN}✓ {text}{Colors.ENDC}")
+    print(f"{_SUCCESS_PREFIX}{text}{_RESET}")
 
 
 def print_warning(text: str):
     """Print warning message."""
-    print(f"{Colors.WARNING}⚠ {text}{Colors.ENDC}")
+    print(f"{_WARNING_PREFIX}{text}{_RESET}")
 
 
 def print_error(text: str):
     """Print error message."""
-    print(f"{Colors.FAIL}✗ {text}{Colors.ENDC}")
+    print(f"{_ERROR_PREFIX}{text}{_RESET}")
 
 
 def print_info(text: str):
     """Print info message."""
-    print(f"{Colors.OKCYAN}ℹ {text}{Colors.ENDC}")
+    print(f"{_INFO_PREFIX}{text}{_RESET}")
 
 
 def ask_yes_no(question: str, default: bool = True) -> bool:
@@ -120,11 +167,50 @@ def ask_yes_no(question: str, default: bool = True) -> bool:
         print("Please answer yes or no.")
 
 
+def _subprocess_env() -> dict:
+    """Environment for child processes.
+
+    Applies PIP_INSTALL's non-interactive settings to pip runs we don't
+    build ourselves (requirements installs triggered by a repository's
+    install.py). Git credential prompts are disabled: all repositories are
+    public, and a prompt for a moved repo would hang concurrent clones and
+    URL checks.
+    """
+    return {
+        **os.environ,
+        "PIP_DISABLE_PIP_VERSION_CHECK": "1",
+        "PIP_NO_INPUT": "1",
+        "GIT_TERMINAL_PROMPT": "0",
+    }
+
+
+def _wait_with_heartbeat(process: subprocess.Popen, cmd, timeout: Optional[int]) -> int:
+    """Wait for a process, printing a heartbeat while it runs.
+
+    Raises:
+        subprocess.TimeoutExpired: If the timeout elapses (process is killed)
+    """
+    start = time.monotonic()
+    while True:
+        wait = HEARTBEAT_INTERVAL
+        if timeout is not None:
+            wait = min(wait, max(timeout - (time.monotonic() - start), 0))
+        try:
+            return process.wait(timeout=wait)
+        except subprocess.TimeoutExpired:
+            elapsed = time.monotonic() - start
+            if timeout is not None and elapsed >= timeout:
+                process.kill()
+                process.wait()
+                raise subprocess.TimeoutExpired(cmd, timeout)
+            print_info(f"Still running... ({elapsed:.0f}s)")
+
+
 def run_command(
     cmd: List[str],
     check: bool = True,
     capture: bool = False,
-    timeout: int = 600,
+    timeout: Optional[int] = None,
     stream: bool = False,
     shell: bool = False
 ) -> Tuple[bool, str]:
@@ -134,34 +220,67 @@ def run_command(
         cmd: Command and arguments
         check: Raise on non-zero exit (only if not capturing)
         capture: Capture output instead of showing it
-        timeout: Timeout in seconds (default 600 = 10 minutes for conda installs)
-        stream: Stream output line by line (for long-running commands)
+        timeout: Timeout in seconds. Visible commands (installs, clones) run
+            without a limit by default; captured commands default to
+            CAPTURE_TIMEOUT, and probes pass PROBE_TIMEOUT
+        stream: Stream output line by line (for long-running commands);
+            only the last STREAM_TAIL_LINES lines are returned
         shell: Use shell execution (required for Windows .bat files)
     """
+    env = _subprocess_env()
     try:
         if capture:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout, shell=shell)
+            if timeout is None:
+                timeout = CAPTURE_TIMEOUT
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout, shell=shell, env=env)
             return result.returncode == 0, result.stdout + result.stderr
         elif stream:
-            import sys
             process = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
                 text=True,
                 bufsize=1,
-                shell=shell
+                shell=shell,
+                env=env
             )
-            output_lines = []
-            for line in iter(process.stdout.readline, ''):
-                print(f"    {line.rstrip()}")
-                sys.stdout.flush()
-                output_lines.append(line)
-            process.wait()
-            return process.returncode == 0, ''.join(output_lines)
+            # readline() blocks on a silent process, so enforce the timeout
+            # by killing it from a timer thread
+            timed_out = threading.Event()
+
+            def kill():
+                timed_out.set()
+                process.kill()
+
+            timer = threading.Timer(timeout, kill) if timeout is not None else None
+            if timer:
+                timer.start()
+            output_tail = collections.deque(maxlen=STREAM_TAIL_LINES)
+            try:
+                for line in iter(process.stdout.readline, ''):
+                    print(f"    {line.rstrip()}")
+                    sys.stdout.flush()
+                    output_tail.append(line)
+                process.wait()
+            finally:
+                if timer:
+                    timer.cancel()
+            if timed_out.is_set():
+                print_warning(f"Command timed out after {timeout}s")
+                return False, ''.join(output_tail)
+            return process.returncode == 0, ''.join(output_tail)
         else:
-            result = subprocess.run(cmd, check=check, timeout=timeout, shell=shell)
-            return result.returncode == 0, ""
+            process = subprocess.Popen(cmd, shell=shell, env=env)
+            try:
+                returncode = _wait_with_heartbeat(process, cmd, timeout)
+            except BaseException:
+                # Don't leave the child running on Ctrl+C
+                process.kill()
+                process.wait()
+                raise
+            if check and returncode != 0:
+                raise subprocess.CalledProcessError(returncode, cmd)
+            return returncode == 0, ""
     except subprocess.TimeoutExpired:
         print_warning(f"Command timed out after {timeout}s")
         return False, ""
@@ -169,53 +288,159 @@ def run_command(
         return False, ""
 
 
-def check_python_package(package: str, import_name: Optional[str] = None) -> bool:
-    """Check if Python package is installed."""
+async def run_command_async(cmd: List[str], timeout: Optional[int] = None) -> Tuple[bool, str]:
+    """Run command without blocking the event loop.
+
+    Output (stdout and stderr merged) is captured rather than shown, since
+    several commands may be running at once.
+
+    Args:
+        cmd: Command and arguments
+        timeout: Timeout in seconds (default: no limit)
+    """
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            env=_subprocess_env(),
+        )
+    except (FileNotFoundError, PermissionError):
+        return False, ""
+
+    try:
+        output, _ = await asyncio.wait_for(process.communicate(), timeout)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        print_warning(f"Command timed out after {timeout}s: {' '.join(cmd)}")
+        return False, ""
+
+    return process.returncode == 0, output.decode(errors='replace')
+
+
+@functools.lru_cache(maxsize=None)
+def check_python_package(package: str, import_name: Optional[str] = None, deep: bool = False) -> bool:
+    """Check if Python package is installed.
+
+    By default only locates the module spec, so heavy packages (torch, cv2)
+    are not executed just to answer whether they exist.
+
+    Args:
+        package: Package name (pip distribution name)
+        import_name: Module name to look up (default: package)
+        deep: Actually import the module to verify it loads
+    """
     import_name = import_name or package
+    if deep:
+        try:
+            __import__(import_name)
+            return True
+        except ImportError:
+            return False
+
     try:
-        __import__(import_name)
-        return True
-    except ImportError:
+        return importlib.util.find_spec(import_name) is not None
+    except (ImportError, ValueError):
+        # Parent package missing for dotted names, or broken __spec__
         return False
 
 
+@functools.lru_cache(maxsize=None)
 def check_command_available(command: str) -> bool:
     """Check if command-line tool is available.
 
     Uses shutil.which() for cross-platform compatibility (Windows/Linux/macOS).
+    Results are cached; call invalidate_check_caches() after installing.
     """
     return shutil.which(command) is not None
 
 
+@functools.lru_cache(maxsize=None)
 def check_gpu_available() -> Tuple[bool, str]:
     """Check if NVIDIA GPU is available."""
-    success, output = run_command(["nvidia-smi"], check=False, capture=True)
+    success, output = run_command(
+        ["nvidia-smi", "--query-gpu=memory.total", "--format=csv,noheader,nounits"],
+        check=False, capture=True, timeout=15
+    )
     if not success:
         return False, "No NVIDIA GPU detected (nvidia-smi failed)"
 
-    # Parse VRAM
+    # One line per GPU with its total memory in MiB; report the first
     try:
-        import re
-        vram_match = re.search(r'(\d+)MiB\s*/\s*(\d+)MiB', output)
-        if vram_match:
-            total_vram = int(vram_match.group(2))
-            return True, f"{total_vram}MB total VRAM"
-    except (ValueError, AttributeError, ImportError):
+        total_vram = int(output.split()[0])
+        return True, f"{total_vram}MB total VRAM"
+    except (ValueError, IndexError):
         pass
 
     return True, "GPU detected"
 
 
+def get_package_version(package: str) -> Optional[str]:
+    """Get the installed version of a distribution without importing it."""
+    try:
+        return importlib.metadata.version(package)
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+def _release_tuple(version: str) -> Tuple[int, ...]:
+    """Leading numeric release segments of a version ("2.1.0+cu121" -> (2, 1, 0))."""
+    release = []
+    for part in version.split('.'):
+        digits = ''
+        for char in part:
+            if not char.isdigit():
+                break
+            digits += char
+        if not digits:
+            break
+        release.append(int(digits))
+        if len(digits) < len(part):
+            break
+    return tuple(release)
+
+
+def version_at_least(version: str, minimum: str) -> bool:
+    """Check that a version string satisfies a minimum version.
+
+    Uses packaging when available, otherwise compares release numbers.
+    """
+    try:
+        from packaging.version import InvalidVersion, Version
+    except ImportError:
+        return _release_tuple(version) >= _release_tuple(minimum)
+    try:
+        return Version(version) >= Version(minimum)
+    except InvalidVersion:
+        return _release_tuple(version) >= _release_tuple(minimum)
+
+
+def invalidate_check_caches() -> None:
+    """Forget cached package/command probe results.
+
+    Call after installing anything so that newly installed packages and
+    tools are detected on the next check.
+    """
+    check_python_package.cache_clear()
+    check_command_available.cache_clear()
+    PlatformManager.invalidate_tool_cache()
+    importlib.invalidate_caches()
+
+
+@functools.lru_cache(maxsize=8)
 def get_disk_space(path: Path = Path.cwd()) -> Tuple[float, float]:
     """Get available and total disk space in GB.
 
+    Results are cached per path (statvfs can be slow on network mounts);
+    call get_disk_space.cache_clear() once disk usage has changed.
+
     Args:
         path: Path to check (default: home directory)
 
     Returns:
         Tuple of (available_gb, total_gb)
     """
-    import shutil
     try:
         stat = shutil.disk_usage(path)
         available_gb = stat.free / (1024**3)
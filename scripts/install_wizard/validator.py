@@ -11,6 +11,7 @@ from env_config import INSTALL_DIR
 
 from .platform import PlatformManager
 from .utils import (
+    PROBE_TIMEOUT,
     print_error,
     print_header,
     print_info,
@@ -90,7 +91,7 @@ class InstallationValidator:
 
         success, output = run_command(
             [colmap_exe, "--version"],
-            check=False, capture=True, shell=is_bat
+            check=False, capture=True, shell=is_bat, timeout=PROBE_TIMEOUT
         )
         if success and output:
             version = output.strip().split('\n')[0] if output else "unknown"
@@ -4,7 +4,10 @@ This module contains the InstallationWizard class that coordinates
 all installation steps and provides the interactive installation flow.
 """
 
+import asyncio
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -36,8 +39,15 @@ from .validator import InstallationValidator
 class InstallationWizard:
     """Main installation wizard."""
 
+    # Concurrent git clones in prefetch_git_repos (network-bound, keep modest)
+    MAX_PARALLEL_CLONES = 4
+
     def __init__(self):
         self.components = {}
+        self._installers: Dict[str, list] = {}
+        # Package installers shared by every component that lists the package
+        self._package_installers: Dict[tuple, PythonPackageInstaller] = {}
+        self._component_sizes: Dict[str, float] = {}
         self.repo_root = INSTALL_DIR.parent
         self.install_dir = INSTALL_DIR
 
@@ -48,17 +58,23 @@ class InstallationWizard:
         self.validator = InstallationValidator(self.conda_manager, self.install_dir)
         self.config_generator = ConfigurationGenerator(self.conda_manager, self.install_dir)
 
-        self.os_name, self.environment, self.pkg_manager = self.platform_manager.detect_platform()
+        ctx = self.platform_manager.get_context()
+        self.os_name, self.environment, self.pkg_manager = ctx.os_name, ctx.environment, ctx.pkg_manager
         self.setup_components()
 
     def setup_components(self):
-        """Define all installable components."""
+        """Define all installable components.
+
+        Installer objects are built on first use via each component's
+        'installers_factory' (see get_installers), so components that are
+        never checked or installed cost nothing.
+        """
 
         # Core dependencies
         self.components['core'] = {
             'name': 'Core Pipeline',
             'required': True,
-            'installers': [
+            'installers_factory': lambda: [
                 PythonPackageInstaller('NumPy', 'numpy', size_gb=0.1),
                 PythonPackageInstaller('OpenCV', 'opencv-python', 'cv2', size_gb=0.3),
                 PythonPackageInstaller('Pillow', 'pillow', 'PIL', size_gb=0.05),
@@ -69,7 +85,7 @@ class InstallationWizard:
         self.components['web_gui'] = {
             'name': 'Web GUI',
             'required': True,
-            'installers': [
+            'installers_factory': lambda: [
                 PythonPackageInstaller('FastAPI', 'fastapi', size_gb=0.02),
                 PythonPackageInstaller('Uvicorn', 'uvicorn', size_gb=0.01),
                 PythonPackageInstaller('Python-Multipart', 'python-multipart', 'python_multipart', size_gb=0.01),
@@ -82,7 +98,7 @@ class InstallationWizard:
         self.components['pytorch'] = {
             'name': 'PyTorch',
             'required': True,
-            'installers': [
+            'installers_factory': lambda: [
                 PythonPackageInstaller('PyTorch', 'torch', size_gb=6.0),  # With CUDA
             ]
         }
@@ -91,7 +107,7 @@ class InstallationWizard:
         self.components['colmap'] = {
             'name': 'COLMAP',
             'required': False,
-            'installers': [
+            'installers_factory': lambda: [
                 SystemPackageInstaller('COLMAP', 'colmap', size_gb=0.5),
             ],
             'size_gb': 0.5,
@@ -101,7 +117,7 @@ class InstallationWizard:
         self.components['mocap_core'] = {
             'name': 'Motion Capture Core',
             'required': False,
-            'installers': [
+            'installers_factory': lambda: [
                 PythonPackageInstaller('SMPL-X', 'smplx', size_gb=0.1),
                 PythonPackageInstaller('Trimesh', 'trimesh', size_gb=0.05),
             ]
@@ -111,12 +127,13 @@ class InstallationWizard:
         self.components['wham'] = {
             'name': 'WHAM',
             'required': False,
-            'installers': [
+            'installers_factory': lambda: [
                 GitRepoInstaller(
                     'WHAM',
                     'https://github.com/yohanshin/WHAM.git',
                     self.install_dir / "WHAM",
-                    size_gb=3.0  # Code + checkpoints
+                    size_gb=3.0,  # Code + checkpoints
+                    full_history=True,  # Updated in place by janitor.py
                 )
             ]
         }
@@ -125,7 +142,7 @@ class InstallationWizard:
         self.components['gvhmr'] = {
             'name': 'GVHMR',
             'required': False,
-            'installers': [
+            'installers_factory': lambda: [
                 GitRepoInstaller(
                     'GVHMR',
                     'https://github.com/zju3dv/GVHMR.git',
@@ -139,7 +156,7 @@ class InstallationWizard:
         self.components['gsir'] = {
             'name': 'GS-IR',
             'required': False,
-            'installers': [
+            'installers_factory': lambda: [
                 GSIRInstaller(
                     install_dir=self.install_dir / "GS-IR",
                     size_gb=2.0
@@ -153,12 +170,13 @@ class InstallationWizard:
             'name': 'ComfyUI',
             'required': False,
             'size_gb': 1.0,  # Video Depth Anything model (downloaded automatically)
-            'installers': [
+            'installers_factory': lambda: [
                 GitRepoInstaller(
                     'ComfyUI',
                     'https://github.com/comfyanonymous/ComfyUI.git',
                     comfyui_dir,
-                    size_gb=2.0
+                    size_gb=2.0,
+                    full_history=True,  # Updated in place by janitor.py
                 ),
                 GitRepoInstaller(
                     'ComfyUI-VideoHelperSuite',
@@ -193,6 +211,30 @@ class InstallationWizard:
             ]
         }
 
+    def get_installers(self, comp_id: str) -> list:
+        """Get the installers for a component, building them on first use.
+
+        A pip package listed by several components gets a single installer
+        instance, so it is only checked and installed once.
+        """
+        installers = self._installers.get(comp_id)
+        if installers is None:
+            installers = []
+            for installer in self.components[comp_id]['installers_factory']():
+                if isinstance(installer, PythonPackageInstaller):
+                    key = (installer.pip_spec, tuple(installer.pip_args))
+                    shared = self._package_installers.get(key)
+                    if shared is not None:
+                        installers.append(shared)
+                        continue
+                    self._package_installers[key] = installer
+                # Set conda manager for environment-aware checking/installation
+                if hasattr(installer, 'set_conda_manager'):
+                    installer.set_conda_manager(self.conda_manager)
+                installers.append(installer)
+            self._installers[comp_id] = installers
+        return installers
+
     def setup_conda_environment(self) -> bool:
         """Set up conda environment."""
         print_header("Conda Environment Setup")
@@ -242,8 +284,24 @@ class InstallationWizard:
             print_error(f"Python {py_version.major}.{py_version.minor} (3.8+ required)")
             return False
 
+        # Run the independent probes (mostly subprocess spawns and PATH walks)
+        # concurrently, then report them in a fixed order
+        def find(tool: str) -> bool:
+            return check_command_available(tool) or bool(PlatformManager.find_tool(tool))
+
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            probes = {
+                'conda': pool.submit(self.conda_manager.detect_conda),
+                'git': pool.submit(check_command_available, "git"),
+                'disk': pool.submit(get_disk_space),
+                'gpu': pool.submit(check_gpu_available),
+                'ffmpeg': pool.submit(find, "ffmpeg"),
+                'colmap': pool.submit(find, "colmap"),
+            }
+            results = {name: future.result() for name, future in probes.items()}
+
         # Conda
-        if self.conda_manager.detect_conda():
+        if results['conda']:
             print_success(f"Conda available ({self.conda_manager.conda_exe})")
         else:
             print_error("Conda not found (required for environment management)")
@@ -251,7 +309,7 @@ class InstallationWizard:
             return False
 
         # Git
-        if check_command_available("git"):
+        if results['git']:
             print_success("Git available")
         else:
             print_error("Git not found (required for cloning repositories)")
@@ -262,7 +320,7 @@ class InstallationWizard:
             return False
 
         # Disk space
-        available_gb, total_gb = get_disk_space()
+        available_gb, total_gb = results['disk']
         if available_gb > 0:
             used_pct = ((total_gb - available_gb) / total_gb) * 100
             if available_gb >= 50:
@@ -278,7 +336,7 @@ class InstallationWizard:
             print_warning("Could not check disk space")
 
         # GPU
-        has_gpu, gpu_info = check_gpu_available()
+        has_gpu, gpu_info = results['gpu']
         if has_gpu:
             print_success(f"GPU: {gpu_info}")
         else:
@@ -286,7 +344,7 @@ class InstallationWizard:
             print_info("Motion capture requires NVIDIA GPU with 12GB+ VRAM")
 
         # ffmpeg
-        if check_command_available("ffmpeg") or PlatformManager.find_tool("ffmpeg"):
+        if results['ffmpeg']:
             print_success("ffmpeg available")
         else:
             print_info("ffmpeg not found - attempting automatic installation...")
@@ -301,7 +359,7 @@ class InstallationWizard:
                 ))
 
         # COLMAP
-        if check_command_available("colmap") or PlatformManager.find_tool("colmap"):
+        if results['colmap']:
             print_success("COLMAP available")
         else:
             print_info("COLMAP not found - attempting automatic installation...")
@@ -317,20 +375,55 @@ class InstallationWizard:
 
         return True
 
-    def check_all_components(self) -> Dict[str, bool]:
-        """Check status of all components."""
-        status = {}
+    def check_all_components(self, component_ids: Optional[List[str]] = None) -> Dict[str, bool]:
+        """Check status of components.
 
-        for comp_id, comp_info in self.components.items():
-            all_installed = True
-            for installer in comp_info['installers']:
-                # Set conda manager for environment-aware checking
-                if hasattr(installer, 'set_conda_manager'):
-                    installer.set_conda_manager(self.conda_manager)
-                if not installer.check():
-                    all_installed = False
-            status[comp_id] = all_installed
+        Installer checks are independent (import probes, conda subprocesses,
+        filesystem stats), so they run concurrently on a thread pool. Passed
+        checks whose fingerprint matches the last run are answered from the
+        persistent state instead; failed checks always run again, since the
+        failure may have been transient.
 
+        Args:
+            component_ids: Components to check (default: all)
+        """
+        if component_ids is None:
+            component_ids = list(self.components)
+
+        status = {comp_id: True for comp_id in component_ids}
+
+        # Installers shared between components are checked once
+        owners: Dict[int, tuple] = {}
+        for comp_id in component_ids:
+            for installer in self.get_installers(comp_id):
+                owners.setdefault(id(installer), (installer, []))[1].append(comp_id)
+
+        tasks = []
+        for installer, comp_ids in owners.values():
+            fingerprint = installer.status_fingerprint()
+            cached = None
+            if fingerprint:
+                cached = self.state_manager.get_cached_check(*fingerprint)
+            if cached:
+                installer.installed = True
+            else:
+                tasks.append((installer, comp_ids, fingerprint))
+
+        if not tasks:
+            return status
+
+        fresh = {}
+        with ThreadPoolExecutor(max_workers=min(16, len(tasks))) as executor:
+            results = executor.map(lambda installer: installer.check(), [installer for installer, _, _ in tasks])
+            for (_, comp_ids, fingerprint), installed in zip(tasks, results):
+                if not installed:
+                    status.update(dict.fromkeys(comp_ids, False))
+                elif fingerprint:
+                    key, value = fingerprint
+                    fresh[key] = (value, installed)
+
+        if fresh:
+            self.state_manager.cache_checks(fresh)
         return status
 
     def print_status(self, status: Dict[str, bool]):
@@ -358,14 +451,21 @@ class InstallationWizard:
         Returns:
             Total disk space needed in GB
         """
-        total_gb = 0.0
-        for comp_id in component_ids:
-            comp_info = self.components.get(comp_id, {})
-            for installer in comp_info.get('installers', []):
-                total_gb += installer.size_gb
+        return sum(
+            self.component_size_gb(comp_id)
+            for comp_id in component_ids
+            if comp_id in self.components
+        )
+
+    def component_size_gb(self, comp_id: str) -> float:
+        """Get the estimated disk space of one component in GB."""
+        size_gb = self._component_sizes.get(comp_id)
+        if size_gb is None:
+            size_gb = sum(installer.size_gb for installer in self.get_installers(comp_id))
             # Add component-level size (for things like COLMAP)
-            total_gb += comp_info.get('size_gb', 0.0)
-        return total_gb
+            size_gb += self.components[comp_id].get('size_gb', 0.0)
+            self._component_sizes[comp_id] = size_gb
+        return size_gb
 
     def show_space_estimate(self, component_ids: List[str]):
         """Show disk space estimate for installation.
@@ -380,12 +480,12 @@ class InstallationWizard:
         total_gb = 0.0
 
         for comp_id in component_ids:
-            comp_info = self.components.get(comp_id, {})
-            comp_size = sum(inst.size_gb for inst in comp_info.get('installers', []))
-            comp_size += comp_info.get('size_gb', 0.0)
+            if comp_id not in self.components:
+                continue
+            comp_size = self.component_size_gb(comp_id)
 
             if comp_size > 0:
-                breakdown.append((comp_info['name'], comp_size))
+                breakdown.append((self.components[comp_id]['name'], comp_size))
                 total_gb += comp_size
 
         # Sort by size (largest first)
@@ -419,6 +519,119 @@ class InstallationWizard:
         print()
         return True
 
+    def preflight_git_repos(self, component_ids: List[str]) -> List[GitRepoInstaller]:
+        """Check that the repositories still to be cloned are reachable.
+
+        Runs `git ls-remote` for each one concurrently so a moved or renamed
+        repository is reported before any download starts.
+
+        Args:
+            component_ids: Components about to be installed
+
+        Returns:
+            Installers whose repository could not be reached
+        """
+        pending = [
+            installer
+            for comp_id in component_ids
+            for installer in self.get_installers(comp_id)
+            if isinstance(installer, GitRepoInstaller) and not installer.is_cloned()
+        ]
+        if not pending:
+            return []
+
+        print_info(f"Checking {len(pending)} repository URLs...")
+        with ThreadPoolExecutor(max_workers=min(8, len(pending))) as executor:
+            results = list(executor.map(lambda installer: installer.preflight(), pending))
+        return [installer for installer, ok in zip(pending, results) if not ok]
+
+    def prefetch_git_repos(self, component_ids: List[str]) -> None:
+        """Clone the git repositories of several components concurrently.
+
+        Clones are network-bound and target disjoint directories, so they are
+        run together with asyncio. Repositories nested inside another pending
+        checkout (ComfyUI custom nodes) wait for their parent's wave. Only the
+        clone happens here; dependency installs stay serial in install_component.
+
+        Args:
+            component_ids: Components about to be installed
+        """
+        remaining = [
+            installer
+            for comp_id in component_ids
+            for installer in self.get_installers(comp_id)
+            if isinstance(installer, GitRepoInstaller) and not installer.is_cloned()
+        ]
+        if len(remaining) < 2:
+            return
+
+        print_info(f"Cloning {len(remaining)} repositories in parallel...")
+
+        async def clone_all(installers):
+            limit = asyncio.Semaphore(self.MAX_PARALLEL_CLONES)
+
+            async def clone(installer):
+                async with limit:
+                    return await installer.clone_async()
+
+            return await asyncio.gather(*(clone(installer) for installer in installers))
+
+        while remaining:
+            wave = [
+                installer for installer in remaining
+                if not any(other.install_dir in installer.install_dir.parents for other in remaining)
+            ]
+            try:
+                results = asyncio.run(clone_all(wave))
+            except (NotImplementedError, RuntimeError) as e:
+                # Event loop can't spawn subprocesses; install() clones serially
+                print_warning(f"Parallel clone unavailable ({e}), cloning during install")
+                return
+            failed = [installer.install_dir for installer, ok in zip(wave, results) if not ok]
+            # Don't populate a failed parent's directory; install() retries it first
+            remaining = [
+                installer for installer in remaining
+                if installer not in wave
+                and not any(path in installer.install_dir.parents for path in failed)
+            ]
+
+    def _batch_pip_install(self, installers: List[PythonPackageInstaller]) -> bool:
+        """Install missing pip packages with a single pip invocation.
+
+        If the batch fails, packages are retried one at a time so a single
+        bad package doesn't block the rest.
+
+        Args:
+            installers: Consecutive package installers from one component
+
+        Returns:
+            True if every package is installed
+        """
+        pending = []
+        for installer in installers:
+            if installer.check():
+                print_success(f"{installer.name} already installed")
+            else:
+                pending.append(installer)
+
+        # Packages needing different pip arguments (e.g. a custom index) can't share a run
+        groups: Dict[tuple, List[PythonPackageInstaller]] = {}
+        for installer in pending:
+            groups.setdefault(tuple(installer.pip_args), []).append(installer)
+
+        success = True
+        for group in groups.values():
+            if PythonPackageInstaller.install_batch(group):
+                continue
+            if len(group) == 1:
+                success = False
+                continue
+
+            print_warning("Batch install failed, retrying packages individually...")
+            results = [installer.install() for installer in group]
+            success = all(results) and success
+        return success
+
     def install_component(self, comp_id: str) -> bool:
         """Install a component."""
         comp_info = self.components[comp_id]
@@ -430,9 +643,7 @@ class InstallationWizard:
         if status == "completed":
             # Verify files actually exist before trusting state
             all_present = True
-            for installer in comp_info['installers']:
-                if hasattr(installer, 'set_conda_manager'):
-                    installer.set_conda_manager(self.conda_manager)
+            for installer in self.get_installers(comp_id):
                 if not installer.check():
                     all_present = False
                     break
@@ -447,17 +658,23 @@ class InstallationWizard:
 
         success = True
         try:
-            for installer in comp_info['installers']:
-                # Set conda manager for environment-aware installation
-                if hasattr(installer, 'set_conda_manager'):
-                    installer.set_conda_manager(self.conda_manager)
+            installers = self.get_installers(comp_id)
 
-                if not installer.check():
-                    if not installer.install():
-                        success = False
-                        break
+            # Consecutive pip packages share one pip run; the declared order is
+            # kept, since later installers may depend on earlier ones
+            for is_pip, group in groupby(installers, key=lambda i: isinstance(i, PythonPackageInstaller)):
+                if is_pip:
+                    success = self._batch_pip_install(list(group))
                 else:
-                    print_success(f"{installer.name} already installed")
+                    for installer in group:
+                        if not installer.check():
+                            if not installer.install():
+                                success = False
+                                break
+                        else:
+                            print_success(f"{installer.name} already installed")
+                if not success:
+                    break
 
             if success:
                 self.state_manager.mark_component_completed(comp_id)
@@ -469,6 +686,8 @@ class InstallationWizard:
             print_error(f"Error installing {comp_info['name']}: {e}")
             success = False
 
+        # Even a failed install may have used disk space
+        get_disk_space.cache_clear()
         return success
 
     def setup_credentials(self, repo_root: Path) -> None:
@@ -623,6 +842,12 @@ class InstallationWizard:
                 else:
                     print("Invalid choice")
 
+        # Components the status check already found installed need no work
+        pending = [comp_id for comp_id in to_install if not status.get(comp_id, False)]
+        already = [self.components[comp_id]['name'] for comp_id in to_install if status.get(comp_id, False)]
+        if already:
+            print_info(f"Already installed: {', '.join(already)}")
+
         # Show disk space estimate
         if to_install:
             if not self.show_space_estimate(to_install):
@@ -635,15 +860,24 @@ class InstallationWizard:
                     print_info("Installation cancelled")
                     return True
 
+            unreachable = self.preflight_git_repos(pending)
+            if unreachable:
+                for installer in unreachable:
+                    print_error(f"{installer.name}: cannot reach {installer.repo_url}")
+                if yolo or not ask_yes_no("\nContinue anyway?", default=False):
+                    print_error("\nInstallation aborted: repositories unreachable")
+                    return False
+
         # Install components
         print_header("Installing Components")
 
-        for comp_id in to_install:
-            if not status.get(comp_id, False):
-                if not self.install_component(comp_id):
-                    print_error(f"Failed to install {self.components[comp_id]['name']}")
-                    if self.components[comp_id]['required']:
-                        return False
+        self.prefetch_git_repos(pending)
+
+        for comp_id in pending:
+            if not self.install_component(comp_id):
+                print_error(f"Failed to install {self.components[comp_id]['name']}")
+                if self.components[comp_id]['required']:
+                    return False
 
         # Download Video Depth Anything model (required for ComfyUI depth workflows)
         if 'comfyui' in to_install:
@@ -677,8 +911,9 @@ class InstallationWizard:
                 print("\n⚠ SMPL-X credentials not found - skipping model download")
                 print("  Run wizard again after setting up credentials to download models")
 
-        # Final status
-        final_status = self.check_all_components()
+        # Final status (only components we just installed can have changed)
+        final_status = dict(status)
+        final_status.update(self.check_all_components(pending))
         self.print_status(final_status)
 
         # Generate configuration files
@@ -14,15 +14,168 @@ Usage:
     # Log file automatically saved and rotated
 """
 
+import functools
+import heapq
+import os
+import platform
+import subprocess
 import sys
 from datetime import datetime
-from io import StringIO
 from pathlib import Path
-from typing import Optional, TextIO
+from typing import List, Optional, TextIO, Tuple
 
 from install_wizard.platform import PlatformManager
 from env_config import is_in_container
 
+# Log file write buffer; lets many small prints land as one large write
+LOG_BUFFER_SIZE = 256 * 1024
+
+# Most output a hard kill (SIGKILL, OOM, native crash) can cost the log:
+# stdout is flushed once this much is pending, stderr at the end of every line
+LOG_FLUSH_BYTES = 8 * 1024
+
+# print_log_summary reads at most this much from each end of a large log
+SUMMARY_HEAD_BYTES = 8 * 1024
+SUMMARY_TAIL_BYTES = 16 * 1024
+SUMMARY_TAIL_LINES = 20
+HEADER_SCAN_LINES = 50
+_HEADER_MARKER = "=" * 80
+
+# Command line arguments recorded in the log header
+MAX_LOGGED_ARGS = 64
+
+
+@functools.lru_cache(maxsize=1)
+def _env_type() -> str:
+    """Get 'docker' or 'conda'; container status can't change mid-process."""
+    return "docker" if is_in_container() else "conda"
+
+
+def _read_git_head(repo_root: Path) -> Optional[str]:
+    """Read the current commit and branch straight from .git.
+
+    Covers a plain repository checkout without spawning git. Returns None
+    when the layout isn't understood (worktrees, submodules, missing refs)
+    so the caller can fall back to the git binary.
+
+    Returns:
+        "abc1234 (branch-name)", "abc1234 (HEAD)" when detached, or None
+    """
+    git_dir = repo_root / ".git"
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+        if not head.startswith("ref: "):
+            return f"{head[:7]} (HEAD)" if head else None
+
+        ref = head[5:]
+        branch = ref[len("refs/heads/"):] if ref.startswith("refs/heads/") else ref
+        ref_file = git_dir / ref
+        if ref_file.is_file():
+            return f"{ref_file.read_text(encoding='utf-8').strip()[:7]} ({branch})"
+
+        with open(git_dir / "packed-refs", encoding="utf-8") as f:
+            for line in f:
+                commit, _, name = line.strip().partition(" ")
+                if name == ref:
+                    return f"{commit[:7]} ({branch})"
+    except OSError:
+        pass
+    return None
+
+
+def _git_state(repo_root: Path) -> Tuple[Optional[int], ...]:
+    """Get mtimes of the files that change whenever the checked-out commit does.
+
+    HEAD changes on a branch switch or checkout; a commit on the current
+    branch only rewrites its ref file (or packed-refs once refs are packed).
+    """
+    git_dir = repo_root / ".git"
+    paths = [git_dir / "HEAD", git_dir / "packed-refs"]
+    try:
+        head = paths[0].read_text(encoding="utf-8").strip()
+        if head.startswith("ref: "):
+            paths.append(git_dir / head[5:])
+    except OSError:
+        pass
+
+    mtimes = []
+    for path in paths:
+        try:
+            mtimes.append(path.stat().st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    return tuple(mtimes)
+
+
+@functools.lru_cache(maxsize=4)
+def _git_commit_cached(repo_root_str: str, git_state: Tuple[Optional[int], ...]) -> str:
+    """Get git commit info for a repository, once per checkout state.
+
+    git_state (from _git_state) is only part of the cache key, so branch
+    switches and new commits within the process are picked up on the next
+    capture.
+    """
+    repo_root = Path(repo_root_str)
+    commit_info = _read_git_head(repo_root)
+    if commit_info:
+        return commit_info
+
+    try:
+        commit_result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=repo_root,
+            capture_output=True,
+            text=True,
+            timeout=2
+        )
+
+        if commit_result.returncode != 0:
+            return "unknown (not a git repository)"
+
+        commit_hash = commit_result.stdout.strip()
+
+        branch_result = subprocess.run(
+            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
+            cwd=repo_root,
+            capture_output=True,
+            text=True,
+            timeout=2
+        )
+
+        if branch_result.returncode == 0:
+            branch = branch_result.stdout.strip()
+            return f"{commit_hash} ({branch})"
+        else:
+            return commit_hash
+
+    except Exception:
+        return "unknown"
+
+
+def _scan_logs(log_dir: Path) -> List[Tuple[float, str]]:
+    """List log files in one directory pass.
+
+    DirEntry caches its stat result, so each file costs one stat at most.
+    Files that vanish mid-scan are skipped.
+
+    Returns:
+        List of (mtime, path) tuples in directory order
+    """
+    entries = []
+    try:
+        with os.scandir(log_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".log"):
+                    continue
+                try:
+                    if entry.is_file():
+                        entries.append((entry.stat().st_mtime, entry.path))
+                except FileNotFoundError:
+                    pass
+    except FileNotFoundError:
+        pass
+    return entries
+
 
 class TeeWriter:
     """Write to multiple streams simultaneously (tee-like behavior).
@@ -32,33 +185,56 @@ class TeeWriter:
     user sees output even if log file writing fails.
     """
 
-    def __init__(self, *streams: TextIO):
+    def __init__(self, *streams: TextIO, flush_bytes: Optional[int] = None):
+        """Initialize the tee.
+
+        Args:
+            streams: Streams to write to, the terminal first
+            flush_bytes: Flush all streams at the end of a line once this
+                many characters are pending (None: only on flush())
+        """
         self.streams = streams
+        self._flush_bytes = flush_bytes
+        self._pending = 0
+        # Bind methods once so each write skips per-stream attribute lookups
+        self._writers = [(getattr(s, 'write', None), getattr(s, 'flush', None)) for s in streams]
 
     def write(self, data: str) -> None:
         """Write data to all streams.
 
         If writing to any stream fails, continues with remaining streams.
         Always writes to first stream (stdout/stderr) first.
+
+        Streams are not flushed on every write; terminals are line-buffered
+        already, and the log file is flushed per flush_bytes, by flush() and
+        when capture ends.
         """
         if not isinstance(data, str):
-            data = str(data)
+            if isinstance(data, (bytes, bytearray)):
+                data = data.decode('utf-8', 'replace')
+            else:
+                data = str(data)
 
-        for stream in self.streams:
+        for write, _ in self._writers:
             try:
-                stream.write(data)
-                stream.flush()
+                write(data)
             except Exception:
                 pass
 
+        if self._flush_bytes is not None:
+            self._pending += len(data)
+            if self._pending >= self._flush_bytes and data.endswith(("\n", "\r")):
+                self.flush()
+
     def flush(self) -> None:
         """Flush all streams.
 
         If flushing any stream fails, continues with remaining streams.
         """
-        for stream in self.streams:
+        self._pending = 0
+        for _, flush in self._writers:
             try:
-                stream.flush()
+                flush()
             except Exception:
                 pass
 
@@ -96,26 +272,28 @@ class LogCapture:
         max_logs: Maximum number of logs to keep (default: 10)
     """
 
-    def __init__(self, log_dir: Path = None, max_logs: int = 10):
+    def __init__(self, log_dir: Path = None, max_logs: int = 10, sink: Optional[TextIO] = None):
         """Initialize log capture.
 
         Args:
             log_dir: Directory for log files (default: repo_root/logs/)
             max_logs: Maximum number of logs to keep (default: 10)
+            sink: Text stream to log to instead of a file. No directory or
+                file is created, nothing is rotated, and the sink is left
+                open for the caller to read.
         """
         if log_dir is None:
             repo_root = Path(__file__).parent.parent
             log_dir = repo_root / "logs"
 
         self.log_dir = Path(log_dir)
-        self.max_logs = max(1, min(max_logs, 100))
+        self.max_logs = max(1, min(int(max_logs), 100))
         self.log_file: Optional[Path] = None
+        self._start_time: Optional[datetime] = None
         self.log_handle: Optional[TextIO] = None
+        self._sink = sink
         self._logging_enabled = False
 
-        self.stdout_buffer = StringIO()
-        self.stderr_buffer = StringIO()
-
         self._original_stdout = sys.stdout if sys.stdout is not None else sys.__stdout__
         self._original_stderr = sys.stderr if sys.stderr is not None else sys.__stderr__
 
@@ -126,19 +304,27 @@ class LogCapture:
         and continues without interrupting the wrapped code.
         """
         try:
-            self.log_dir.mkdir(parents=True, exist_ok=True)
-            self.log_file = self._generate_log_filename()
-            self.log_handle = open(self.log_file, 'w', encoding='utf-8')
+            # One timestamp for both the filename and the header
+            self._start_time = datetime.now()
+            if self._sink is not None:
+                self.log_handle = self._sink
+            else:
+                self.log_dir.mkdir(parents=True, exist_ok=True)
+                self.log_file = self._generate_log_filename()
+                self.log_handle = open(
+                    self.log_file, 'w', encoding='utf-8', buffering=LOG_BUFFER_SIZE, newline=''
+                )
             self._write_log_header()
 
-            sys.stdout = TeeWriter(self._original_stdout, self.stdout_buffer, self.log_handle)
-            sys.stderr = TeeWriter(self._original_stderr, self.stderr_buffer, self.log_handle)
+            # Tracebacks must reach disk even if the process is then killed
+            sys.stdout = TeeWriter(self._original_stdout, self.log_handle, flush_bytes=LOG_FLUSH_BYTES)
+            sys.stderr = TeeWriter(self._original_stderr, self.log_handle, flush_bytes=1)
 
             self._logging_enabled = True
 
         except Exception:
             self._logging_enabled = False
-            if self.log_handle:
+            if self.log_handle and self.log_handle is not self._sink:
                 try:
                     self.log_handle.close()
                 except Exception:
@@ -167,11 +353,13 @@ class LogCapture:
                 pass
 
             try:
-                self.log_handle.close()
+                self.log_handle.flush()
+                if self.log_handle is not self._sink:
+                    self.log_handle.close()
             except Exception:
                 pass
 
-        if self._logging_enabled:
+        if self._logging_enabled and self._sink is None:
             try:
                 self._rotate_logs()
             except Exception:
@@ -194,42 +382,43 @@ class LogCapture:
         Returns:
             Path to log file
         """
-        now = datetime.now()
-        timestamp = now.strftime("%Y%m%d_%H%M%S")
-        microseconds = f"{now.microsecond:06d}"
+        now = self._start_time or datetime.now()
 
         os_name, environment, _ = PlatformManager.detect_platform()
 
         if environment == "wsl2":
             os_name = "wsl2"
 
-        env_type = "docker" if is_in_container() else "conda"
+        env_type = _env_type()
 
-        filename = f"{timestamp}_{microseconds}_{os_name}_{env_type}.log"
+        filename = (
+            f"{now.year:04d}{now.month:02d}{now.day:02d}_"
+            f"{now.hour:02d}{now.minute:02d}{now.second:02d}_{now.microsecond:06d}_"
+            f"{os_name}_{env_type}.log"
+        )
         return self.log_dir / filename
 
     def _write_log_header(self) -> None:
         """Write metadata header to log file."""
-        import platform
-        import subprocess
-        import sys as sys_module
-
         os_name, environment, pkg_mgr = PlatformManager.detect_platform()
-        env_type = "docker" if is_in_container() else "conda"
+        env_type = _env_type()
 
         git_commit = self._get_git_commit()
 
-        command_str = ' '.join(str(arg) for arg in sys_module.argv)
+        argv = sys.argv
+        command_str = ' '.join(map(str, argv[:MAX_LOGGED_ARGS]))
+        if len(argv) > MAX_LOGGED_ARGS:
+            command_str += f" ... ({len(argv) - MAX_LOGGED_ARGS} more args)"
 
         header = f"""{'='*80}
 VFX Pipeline Log
 {'='*80}
-Timestamp:       {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+Timestamp:       {(self._start_time or datetime.now()).strftime("%Y-%m-%d %H:%M:%S")}
 Git Commit:      {git_commit}
 OS:              {os_name} ({environment})
 Package Manager: {pkg_mgr}
 Environment:     {env_type}
-Python Version:  {sys_module.version.split()[0]}
+Python Version:  {sys.version.split()[0]}
 Platform:        {platform.platform()}
 Command:         {command_str}
 {'='*80}
@@ -245,51 +434,29 @@ Command:         {command_str}
             Git commit info or 'unknown' if not available.
             Format: "abc1234 (branch-name)" or "abc1234 (detached HEAD)"
         """
-        try:
-            import subprocess
-            repo_root = Path(__file__).parent.parent
+        # Test suites can opt out of the lookup entirely
+        if os.environ.get("LOG_MANAGER_SKIP_GIT") == "1":
+            return os.environ.get("LOG_MANAGER_FAKE_COMMIT", "unknown")
 
-            commit_result = subprocess.run(
-                ["git", "rev-parse", "--short", "HEAD"],
-                cwd=repo_root,
-                capture_output=True,
-                text=True,
-                timeout=2
-            )
-
-            if commit_result.returncode != 0:
-                return "unknown (not a git repository)"
-
-            commit_hash = commit_result.stdout.strip()
-
-            branch_result = subprocess.run(
-                ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-                cwd=repo_root,
-                capture_output=True,
-                text=True,
-                timeout=2
-            )
-
-            if branch_result.returncode == 0:
-                branch = branch_result.stdout.strip()
-                return f"{commit_hash} ({branch})"
-            else:
-                return commit_hash
-
-        except Exception:
-            return "unknown"
+        repo_root = Path(__file__).parent.parent
+        return _git_commit_cached(str(repo_root), _git_state(repo_root))
 
     def _rotate_logs(self) -> None:
         """Keep only the newest max_logs log files."""
-        log_files = sorted(
-            self.log_dir.glob("*.log"),
-            key=lambda p: p.stat().st_mtime,
-            reverse=True
-        )
+        log_files = _scan_logs(self.log_dir)
+        if len(log_files) <= self.max_logs:
+            return
+
+        # Only the newest max_logs need ordering; everything else goes
+        keep = {path for _, path in heapq.nlargest(self.max_logs, log_files)}
 
-        for old_log in log_files[self.max_logs:]:
-            old_log.unlink()
-            print(f"Rotated old log: {old_log.name}", file=self._original_stdout)
+        rotated = []
+        for _, path in log_files:
+            if path not in keep:
+                os.unlink(path)
+                rotated.append(os.path.basename(path))
+
+        print(f"Rotated {len(rotated)} old log(s): {', '.join(rotated)}", file=self._original_stdout)
 
     def get_log_path(self) -> Optional[Path]:
         """Get path to current log file.
@@ -314,18 +481,41 @@ def get_recent_logs(log_dir: Path = None, count: int = 10) -> list[Path]:
         repo_root = Path(__file__).parent.parent
         log_dir = repo_root / "logs"
 
-    log_files = sorted(
-        log_dir.glob("*.log"),
-        key=lambda p: p.stat().st_mtime,
-        reverse=True
-    )
+    return [Path(path) for _, path in heapq.nlargest(count, _scan_logs(log_dir))]
+
+
+def _decode_log(data: bytes) -> Tuple[List[str], bool]:
+    """Decode log bytes as UTF-8, falling back to Latin-1.
+
+    Returns:
+        (lines, used_latin1)
+    """
+    try:
+        return data.decode('utf-8').splitlines(), False
+    except UnicodeDecodeError:
+        return data.decode('latin-1').splitlines(), True
+
 
-    return log_files[:count]
+def _find_header_end(lines: List[str]) -> int:
+    """Get index of the first line after the log header (0 if none).
+
+    The header is written first and is only a dozen lines long, so only
+    the first HEADER_SCAN_LINES lines are looked at.
+    """
+    for i in range(1, min(len(lines), HEADER_SCAN_LINES)):
+        if lines[i].startswith(_HEADER_MARKER):
+            return i + 2
+    return 0
 
 
 def print_log_summary(log_file: Path) -> None:
     """Print summary of a log file (header + last 20 lines).
 
+    Large logs are not read whole: the header comes from the first
+    SUMMARY_HEAD_BYTES, the tail from the last SUMMARY_TAIL_BYTES, and the
+    skipped middle is reported as an approximate size rather than a line
+    count, which would need a pass over the whole file.
+
     Args:
         log_file: Path to log file
     """
@@ -334,28 +524,47 @@ def print_log_summary(log_file: Path) -> None:
         return
 
     try:
-        lines = log_file.read_text(encoding='utf-8').splitlines()
-    except UnicodeDecodeError:
-        try:
-            lines = log_file.read_text(encoding='latin-1').splitlines()
-            print("Warning: Log file is not UTF-8, reading as Latin-1", file=sys.stderr)
-        except Exception as e:
-            print(f"Error reading log file: {e}", file=sys.stderr)
-            return
+        with open(log_file, 'rb') as f:
+            size = f.seek(0, os.SEEK_END)
+            f.seek(0)
+            omitted = None  # Description of the skipped middle, if any
+            latin1 = False
+
+            if size > SUMMARY_HEAD_BYTES + SUMMARY_TAIL_BYTES:
+                # Drop the partial last line of the head and first line of the tail
+                lines, head_latin1 = _decode_log(b"\n".join(f.read(SUMMARY_HEAD_BYTES).splitlines()[:-1]))
+                f.seek(size - SUMMARY_TAIL_BYTES)
+                tail_lines, tail_latin1 = _decode_log(b"\n".join(f.read().splitlines()[1:]))
+                tail_lines = tail_lines[-SUMMARY_TAIL_LINES:]
+
+                if len(tail_lines) == SUMMARY_TAIL_LINES:
+                    latin1 = head_latin1 or tail_latin1
+                    header_end = _find_header_end(lines)
+                    shown = "\n".join(lines[:header_end] + tail_lines)
+                    shown_bytes = len(shown.encode('latin-1' if latin1 else 'utf-8', 'replace'))
+                    omitted = f"about {(size - shown_bytes) / 1024:,.0f} KB omitted"
+                else:
+                    # Few, very long lines: the tail window can't cover it
+                    f.seek(0)
+
+            if omitted is None:
+                lines, latin1 = _decode_log(f.read())
+                header_end = _find_header_end(lines)
+                tail_lines = lines[-SUMMARY_TAIL_LINES:]
+                hidden = len(lines) - header_end - SUMMARY_TAIL_LINES
+                if hidden > 0:
+                    omitted = f"{hidden} lines omitted"
     except Exception as e:
         print(f"Error reading log file: {e}", file=sys.stderr)
         return
 
-    header_end = 0
-    for i, line in enumerate(lines):
-        if line.startswith("="*80) and i > 0:
-            header_end = i + 2
-            break
+    if latin1:
+        print("Warning: Log file is not UTF-8, reading as Latin-1", file=sys.stderr)
 
     print("\n".join(lines[:header_end]))
 
-    if len(lines) > header_end + 20:
-        print(f"\n... ({len(lines) - header_end - 20} lines omitted) ...\n")
-        print("\n".join(lines[-20:]))
+    if omitted:
+        print(f"\n... ({omitted}) ...\n")
+        print("\n".join(tail_lines))
     else:
         print("\n".join(lines[header_end:]))
@@ -7,248 +7,309 @@ Tests that logging never interrupts critical user code, even when:
 - Exceptions occur in user code
 - Log rotation fails
 
-All tests should pass without raising exceptions.
+Run with pytest, or directly: python scripts/test_log_manager.py
 """
 
+import io
+import os
+import re
 import sys
 import tempfile
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
+
+import pytest
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from log_manager import LogCapture, get_recent_logs
+import log_manager
+from log_manager import LogCapture
 
+# Keep scratch log directories in RAM where a tmpfs is available
+TMPBASE = "/dev/shm" if sys.platform.startswith("linux") and os.path.isdir("/dev/shm") else None
 
-def test_normal_operation():
-    """Test 1: Normal operation - logging should work."""
-    print("\n=== Test 1: Normal Operation ===")
+# Everything the tests look for in a log, found in one pass per file
+_LOG_MARKERS = re.compile(
+    r"FATAL ERROR|ValueError|Git Commit:      unknown|Test message to stdout|Test message to stderr"
+)
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        test_log_dir = Path(tmpdir) / "logs"
 
-        with LogCapture(log_dir=test_log_dir) as capture:
-            print("Test message to stdout")
-            print("Test message to stderr", file=sys.stderr)
+def _first_log(log_dir: Path):
+    """Get any one log file in log_dir, or None."""
+    with os.scandir(log_dir) as it:
+        return next((Path(e.path) for e in it if e.name.endswith(".log")), None)
 
-        logs = list(test_log_dir.glob("*.log"))
-        if logs:
-            print(f"✓ Log file created: {logs[0].name}")
-            content = logs[0].read_text()
-            if "Test message to stdout" in content and "Test message to stderr" in content:
-                print("✓ Both stdout and stderr captured")
-            else:
-                print("✗ FAIL: Messages not in log")
-        else:
-            print("✗ FAIL: No log file created")
 
+def _count_logs(log_dir: Path) -> int:
+    """Count log files in log_dir."""
+    with os.scandir(log_dir) as it:
+        return sum(1 for e in it if e.name.endswith(".log"))
 
-def test_cannot_create_directory():
-    """Test 2: Log directory creation fails - user code should still run."""
-    print("\n=== Test 2: Cannot Create Directory ===")
 
-    user_code_ran = False
+@pytest.fixture(autouse=True)
+def skip_git(monkeypatch):
+    """No git lookups for the captures under test (test_git_unavailable opts back in)."""
+    monkeypatch.setenv("LOG_MANAGER_SKIP_GIT", "1")
 
-    with patch('pathlib.Path.mkdir', side_effect=PermissionError("No permission")):
-        try:
-            with LogCapture(log_dir="/nonexistent/readonly/logs"):
-                print("User code running despite logging failure")
-                user_code_ran = True
-        except PermissionError:
-            print("✗ FAIL: PermissionError not caught - user code interrupted")
 
-    if user_code_ran:
-        print("✓ User code ran successfully despite directory creation failure")
-    else:
-        print("✗ FAIL: User code did not run")
+@pytest.fixture(scope="session")
+def shared_log_base():
+    """One scratch directory for the whole session, cleaned up once."""
+    with tempfile.TemporaryDirectory(dir=TMPBASE) as tmpdir:
+        yield Path(tmpdir)
 
 
-def test_cannot_open_log_file():
-    """Test 3: Log file open fails - user code should still run."""
-    print("\n=== Test 3: Cannot Open Log File ===")
+@pytest.fixture
+def log_dir(shared_log_base, request):
+    """Fresh, not yet created log directory for one test."""
+    return shared_log_base / request.node.name
 
-    user_code_ran = False
 
-    original_open = open
-    def mock_open(file, *args, **kwargs):
-        if str(file).endswith('.log'):
-            raise OSError("Disk full")
-        return original_open(file, *args, **kwargs)
+def test_normal_operation(log_dir):
+    """Normal operation - stdout and stderr both reach the log file."""
+    with LogCapture(log_dir=log_dir):
+        print("Test message to stdout")
+        print("Test message to stderr", file=sys.stderr)
 
-    with patch('builtins.open', side_effect=mock_open):
-        try:
-            with LogCapture():
-                print("User code running despite log file open failure")
-                user_code_ran = True
-        except OSError:
-            print("✗ FAIL: OSError not caught - user code interrupted")
+    log_file = _first_log(log_dir)
+    assert log_file, "No log file created"
+    hits = set(_LOG_MARKERS.findall(log_file.read_text()))
+    assert {"Test message to stdout", "Test message to stderr"} <= hits
 
-    if user_code_ran:
-        print("✓ User code ran successfully despite file open failure")
-    else:
-        print("✗ FAIL: User code did not run")
 
+@pytest.mark.parametrize("failure", [
+    patch('pathlib.Path.mkdir', side_effect=PermissionError("No permission")),
+    # Only log_manager's own open() is replaced; the rest of the process is untouched
+    patch('log_manager.open', side_effect=OSError("Disk full"), create=True),
+], ids=["cannot_create_directory", "cannot_open_log_file"])
+def test_setup_failure_does_not_interrupt(log_dir, failure):
+    """Logging setup fails - user code still runs, logging is disabled."""
+    user_code_ran = False
 
-def test_exception_in_user_code():
-    """Test 4: Exception in user code - should be logged and propagated."""
-    print("\n=== Test 4: Exception in User Code ===")
+    with failure:
+        with LogCapture(log_dir=log_dir) as capture:
+            print("User code running despite logging failure")
+            user_code_ran = True
 
-    exception_caught = False
+    assert user_code_ran
+    assert capture.get_log_path() is None
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        test_log_dir = Path(tmpdir) / "logs"
 
-        try:
-            with LogCapture(log_dir=test_log_dir):
-                print("About to raise exception")
-                raise ValueError("Test exception")
-        except ValueError as e:
-            if str(e) == "Test exception":
-                exception_caught = True
-                print("✓ Exception propagated correctly")
+def test_exception_in_user_code():
+    """Exception in user code - logged and propagated."""
+    sink = io.StringIO()
+    with pytest.raises(ValueError, match="Test exception"):
+        with LogCapture(sink=sink):
+            print("About to raise exception")
+            raise ValueError("Test exception")
 
-        logs = list(test_log_dir.glob("*.log"))
-        if logs:
-            content = logs[0].read_text()
-            if "FATAL ERROR" in content and "ValueError" in content:
-                print("✓ Exception logged to file")
-            else:
-                print("✗ FAIL: Exception not properly logged")
-        else:
-            print("⚠ Warning: No log file (logging may have failed silently)")
+    hits = set(_LOG_MARKERS.findall(sink.getvalue()))
+    assert {"FATAL ERROR", "ValueError"} <= hits
 
-    if not exception_caught:
-        print("✗ FAIL: Exception not propagated")
 
+def test_log_rotation(log_dir):
+    """Log rotation - only the newest max_logs logs are kept."""
+    max_logs = 3
 
-def test_log_rotation():
-    """Test 5: Log rotation - should keep only newest N logs."""
-    print("\n=== Test 5: Log Rotation ===")
+    # Fabricate older logs instead of running a capture for each one
+    log_dir.mkdir(parents=True)
+    for i in range(max_logs):
+        old_log = log_dir / f"old_{i}.log"
+        old_log.touch()
+        os.utime(old_log, (i + 1, i + 1))
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        test_log_dir = Path(tmpdir) / "logs"
-        max_logs = 3
+    with LogCapture(log_dir=log_dir, max_logs=max_logs) as capture:
+        print("Creating newest log")
 
-        for i in range(5):
-            with LogCapture(log_dir=test_log_dir, max_logs=max_logs):
-                print(f"Creating log {i+1}")
+    assert _count_logs(log_dir) == max_logs
+    assert capture.get_log_path().exists()
+    assert not (log_dir / "old_0.log").exists()
 
-        logs = list(test_log_dir.glob("*.log"))
-        if len(logs) == max_logs:
-            print(f"✓ Rotation working: {len(logs)} logs kept (max: {max_logs})")
-        else:
-            print(f"✗ FAIL: Expected {max_logs} logs, found {len(logs)}")
 
+def test_output_reaches_disk_before_exit(log_dir):
+    """stderr lines and a flush threshold of stdout hit the file mid-capture."""
+    with LogCapture(log_dir=log_dir) as capture:
+        print("Test message to stderr", file=sys.stderr)
+        assert "Test message to stderr" in capture.get_log_path().read_text()
 
-def test_nested_capture():
-    """Test 6: Nested LogCapture (should be avoided, but shouldn't crash)."""
-    print("\n=== Test 6: Nested Capture (edge case) ===")
+        print("x" * log_manager.LOG_FLUSH_BYTES)
+        assert "x" * log_manager.LOG_FLUSH_BYTES in capture.get_log_path().read_text()
 
-    user_code_ran = False
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        test_log_dir = Path(tmpdir) / "logs"
+def test_nested_capture():
+    """Nested LogCapture (should be avoided, but shouldn't crash)."""
+    user_code_ran = False
 
-        try:
-            with LogCapture(log_dir=test_log_dir):
-                print("Outer capture")
-                with LogCapture(log_dir=test_log_dir):
-                    print("Inner capture")
-                    user_code_ran = True
-                print("Back to outer")
-        except Exception as e:
-            print(f"✗ FAIL: Nested capture raised exception: {e}")
+    with LogCapture(sink=io.StringIO()):
+        print("Outer capture")
+        with LogCapture(sink=io.StringIO()):
+            print("Inner capture")
+            user_code_ran = True
+        print("Back to outer")
 
-    if user_code_ran:
-        print("✓ Nested capture handled (not recommended, but doesn't crash)")
-    else:
-        print("✗ FAIL: Inner code did not run")
+    assert user_code_ran
 
 
 def test_write_failure_during_operation():
-    """Test 7: Write fails during operation - should not crash."""
-    print("\n=== Test 7: Write Failure During Operation ===")
-
+    """Log stream closed mid-run - user code keeps running."""
     user_code_completed = False
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        test_log_dir = Path(tmpdir) / "logs"
-
-        try:
-            with LogCapture(log_dir=test_log_dir) as capture:
-                print("Message 1")
-
-                if capture.log_handle:
-                    capture.log_handle.close()
-
-                print("Message 2 (log file closed)")
-                user_code_completed = True
-        except Exception as e:
-            print(f"✗ FAIL: Exception raised when log file closed: {e}")
+    with LogCapture(sink=io.StringIO()) as capture:
+        print("Message 1")
 
-    if user_code_completed:
-        print("✓ Continued running even after log file was closed")
-    else:
-        print("✗ FAIL: Did not complete user code")
+        if capture.log_handle:
+            capture.log_handle.close()
 
+        print("Message 2 (log file closed)")
+        user_code_completed = True
 
-def test_git_unavailable():
-    """Test 8: Git unavailable - should still log with 'unknown'."""
-    print("\n=== Test 8: Git Unavailable ===")
+    assert user_code_completed
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        test_log_dir = Path(tmpdir) / "logs"
 
-        with patch('subprocess.run', side_effect=FileNotFoundError("git not found")):
-            try:
-                with LogCapture(log_dir=test_log_dir):
-                    print("Running without git")
-            except FileNotFoundError:
-                print("✗ FAIL: FileNotFoundError not caught")
+def test_bytes_written_as_text():
+    """Bytes written to sys.stdout are decoded, bad UTF-8 becoming U+FFFD."""
+    sink = io.StringIO()
+    with LogCapture(sink=sink):
+        sys.stdout.write(b"caf\xc3\xa9\n")
+        sys.stdout.write(b"bad \xff byte\n")
 
-        logs = list(test_log_dir.glob("*.log"))
-        if logs:
-            content = logs[0].read_text()
-            if "Git Commit:" in content and "unknown" in content:
-                print("✓ Log created with 'unknown' git commit")
-            else:
-                print("✗ FAIL: Git commit line not handled properly")
-        else:
-            print("✗ FAIL: No log file created")
+    log = sink.getvalue()
+    assert "caf\u00e9\n" in log
+    assert "bad \ufffd byte\n" in log
+    assert "b'" not in log
+
+
+def test_sink_keeps_logs_off_disk(log_dir):
+    """A sink receives header and output; no directory or file is created."""
+    sink = io.StringIO()
+    with LogCapture(log_dir=log_dir, sink=sink) as capture:
+        print("Test message to stdout")
+
+    assert "Test message to stdout" in _LOG_MARKERS.findall(sink.getvalue())
+    assert sink.getvalue().startswith("=" * 80)
+    assert capture.get_log_path() is None
+    assert not log_dir.exists()
+
+
+def test_long_command_line_truncated(monkeypatch):
+    """Only the first MAX_LOGGED_ARGS arguments are logged, with a count of the rest."""
+    monkeypatch.setattr(sys, "argv", ["run.py"] + [f"frame_{i:04d}.png" for i in range(99)])
+    sink = io.StringIO()
+    with LogCapture(sink=sink):
+        pass
+
+    command = next(line for line in sink.getvalue().splitlines() if line.startswith("Command:"))
+    logged = sys.argv[:log_manager.MAX_LOGGED_ARGS]
+    assert command.endswith(" ".join(logged) + " ... (36 more args)")
+    assert sys.argv[log_manager.MAX_LOGGED_ARGS] not in command
+
+
+def test_git_unavailable(log_dir, monkeypatch):
+    """Git unavailable - log is still written with 'unknown' commit."""
+    monkeypatch.delenv("LOG_MANAGER_SKIP_GIT")
+    log_manager._git_commit_cached.cache_clear()
+    with patch('subprocess.run', side_effect=FileNotFoundError("git not found")), \
+            patch('log_manager._read_git_head', return_value=None):
+        with LogCapture(log_dir=log_dir):
+            print("Running without git")
+    log_manager._git_commit_cached.cache_clear()
+
+    log_file = _first_log(log_dir)
+    assert log_file, "No log file created"
+    assert "Git Commit:      unknown" in _LOG_MARKERS.findall(log_file.read_text())
+
+
+def test_find_header_end():
+    """The header ends two lines after its closing marker."""
+    marker = log_manager._HEADER_MARKER
+    lines = [marker, "VFX Pipeline Log", marker, "Git Commit:      abc1234", marker, "", "output"]
+    assert log_manager._find_header_end(lines) == 4
+
+
+def test_find_header_end_headerless():
+    """A log without a header (or only an opening marker) has none to skip."""
+    assert log_manager._find_header_end(["plain output"] * 100) == 0
+    assert log_manager._find_header_end([log_manager._HEADER_MARKER] + ["plain output"] * 100) == 0
+
+
+def test_find_header_end_marker_past_scan_window():
+    """A marker past HEADER_SCAN_LINES is output, not the header's end."""
+    lines = [log_manager._HEADER_MARKER] + ["output"] * log_manager.HEADER_SCAN_LINES
+    lines.append(log_manager._HEADER_MARKER)
+    assert log_manager._find_header_end(lines) == 0
+
+
+def test_large_log_summary(log_dir, capsys):
+    """Large log - header and last lines shown, the middle skipped unread."""
+    with LogCapture(log_dir=log_dir) as capture:
+        for i in range(20000):
+            print(f"Line {i}")
+
+    capsys.readouterr()
+    log_manager.print_log_summary(capture.get_log_path())
+    out = capsys.readouterr().out
+
+    assert out.startswith("=" * 80)
+    assert "KB omitted) ..." in out
+    assert "\nLine 19980\n" in out
+    assert "\nLine 19999\n" in out
+    assert "\nLine 100\n" not in out
+    assert "\nLine 19979\n" not in out
+
+
+def _make_git_dir(repo_root: Path, head: str, refs=None, packed_refs=None) -> Path:
+    """Lay out a minimal .git directory for _read_git_head."""
+    git_dir = repo_root / ".git"
+    git_dir.mkdir(parents=True)
+    (git_dir / "HEAD").write_text(head + "\n")
+    for ref, commit in (refs or {}).items():
+        (git_dir / ref).parent.mkdir(parents=True, exist_ok=True)
+        (git_dir / ref).write_text(commit + "\n")
+    if packed_refs is not None:
+        (git_dir / "packed-refs").write_text(packed_refs)
+    return git_dir
+
+
+@pytest.mark.parametrize("head, refs, packed_refs, expected", [
+    ("ref: refs/heads/main", {"refs/heads/main": "abc1234def5678"}, None, "abc1234 (main)"),
+    ("ref: refs/heads/feature/x",
+     None,
+     "# pack-refs with: peeled fully-peeled sorted\n"
+     "1111111aaaa refs/heads/main\n"
+     "2222222bbbb refs/heads/feature/x\n",
+     "2222222 (feature/x)"),
+    ("abc1234def5678", None, None, "abc1234 (HEAD)"),
+    ("ref: refs/heads/gone", None, None, None),
+], ids=["loose_ref", "packed_ref", "detached", "missing_ref"])
+def test_read_git_head(tmp_path, head, refs, packed_refs, expected):
+    """Commit and branch are read from each .git layout without git."""
+    _make_git_dir(tmp_path, head, refs, packed_refs)
+    assert log_manager._read_git_head(tmp_path) == expected
+
+
+def test_read_git_head_gitfile(tmp_path):
+    """A .git file (worktree or submodule) is left to the git binary."""
+    (tmp_path / ".git").write_text("gitdir: /elsewhere/.git/worktrees/x\n")
+    assert log_manager._read_git_head(tmp_path) is None
+
+
+def test_git_commit_follows_new_commits(tmp_path):
+    """A commit on the current branch (ref file only) is picked up."""
+    git_dir = _make_git_dir(tmp_path, "ref: refs/heads/main", {"refs/heads/main": "aaaaaaa1111"})
+    repo = str(tmp_path)
+    assert log_manager._git_commit_cached(repo, log_manager._git_state(tmp_path)) == "aaaaaaa (main)"
+
+    ref_file = git_dir / "refs" / "heads" / "main"
+    ref_file.write_text("bbbbbbb2222\n")
+    stat = ref_file.stat()
+    os.utime(ref_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert log_manager._git_commit_cached(repo, log_manager._git_state(tmp_path)) == "bbbbbbb (main)"
 
 
 def main():
-    """Run all tests."""
-    print("="*80)
-    print("LOG MANAGER FAIL-SAFE TEST SUITE")
-    print("="*80)
-    print("\nTesting that logging NEVER interrupts user code...")
-
-    tests = [
-        test_normal_operation,
-        test_cannot_create_directory,
-        test_cannot_open_log_file,
-        test_exception_in_user_code,
-        test_log_rotation,
-        test_nested_capture,
-        test_write_failure_during_operation,
-        test_git_unavailable,
-    ]
-
-    for test_func in tests:
-        try:
-            test_func()
-        except Exception as e:
-            print(f"\n✗ CRITICAL FAILURE in {test_func.__name__}: {e}")
-            import traceback
-            traceback.print_exc()
-
-    print("\n" + "="*80)
-    print("TEST SUITE COMPLETE")
-    print("="*80)
-    print("\nIf all tests passed with ✓, logging is fail-safe.")
-    print("User code will never be interrupted by logging failures.\n")
+    """Run the suite standalone."""
+    return pytest.main([__file__, "-q", "-p", "no:cacheprovider"])
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -5,11 +5,14 @@ Usage:
     ./start_web.py              # Start server and open browser
     ./start_web.py --no-browser # Start server only
     ./start_web.py --port 8080  # Use custom port
+
+Set VFX_SKIP_ENV_CHECK=1 to skip the conda environment check (CI or
+containers where the environment is known to be right).
 """
 
 import argparse
+import os
 import sys
-import webbrowser
 from pathlib import Path
 
 # Add scripts to path for imports
@@ -17,6 +20,19 @@ sys.path.insert(0, str(Path(__file__).parent / "scripts"))
 
 from log_manager import LogCapture
 
+_BANNER = """
+╔════════════════════════════════════════════════════════╗
+║           VFX Pipeline Web Interface                   ║
+╠════════════════════════════════════════════════════════╣
+║                                                        ║
+║   Server running at: {url:<29} ║
+║                                                        ║
+║   Press Ctrl+C to stop                                 ║
+║                                                        ║
+╚════════════════════════════════════════════════════════╝
+"""
+
+
 def main():
     parser = argparse.ArgumentParser(description="Launch VFX Pipeline web interface")
     parser.add_argument("--no-browser", action="store_true", help="Don't auto-open browser")
@@ -25,15 +41,15 @@ def main():
     args = parser.parse_args()
 
     # Check conda environment first
-    try:
-        from env_config import require_conda_env
-        require_conda_env()  # Exits with helpful message if wrong env
-    except ImportError:
-        # env_config not found - check manually
-        import os
-        conda_env = os.environ.get("CONDA_DEFAULT_ENV")
-        if conda_env != "vfx-pipeline":
-            print("""
+    if os.environ.get("VFX_SKIP_ENV_CHECK") != "1":
+        try:
+            from env_config import require_conda_env
+            require_conda_env()  # Exits with helpful message if wrong env
+        except ImportError:
+            # env_config not found - check manually
+            conda_env = os.environ.get("CONDA_DEFAULT_ENV")
+            if conda_env != "vfx-pipeline":
+                print("""
 ERROR: Wrong conda environment.
 
 Please activate the VFX Pipeline environment first:
@@ -41,12 +57,11 @@ Please activate the VFX Pipeline environment first:
 
 Then re-run this script.
 """)
-            sys.exit(1)
+                sys.exit(1)
 
-    # Check for required dependencies
-    try:
-        import uvicorn
-    except ImportError:
+    # Check for required dependencies (locate only; importing uvicorn is slow)
+    import importlib.util
+    if importlib.util.find_spec("uvicorn") is None:
         print("""
 ERROR: Web GUI dependencies not installed.
 
@@ -60,24 +75,20 @@ Or run the install wizard:
 
     url = f"http://{args.host}:{args.port}"
 
-    print(f"""
-╔════════════════════════════════════════════════════════╗
-║           VFX Pipeline Web Interface                   ║
-╠════════════════════════════════════════════════════════╣
-║                                                        ║
-║   Server running at: {url:<29} ║
-║                                                        ║
-║   Press Ctrl+C to stop                                 ║
-║                                                        ║
-╚════════════════════════════════════════════════════════╝
-""")
+    print(_BANNER.format(url=url))
+
+    import uvicorn
+    from web.server import app
 
-    # Open browser (unless disabled)
+    # Open browser (unless disabled) once the server has had time to bind;
+    # armed after the imports so their cost doesn't eat into the delay
     if not args.no_browser:
-        webbrowser.open(url)
+        import threading
+        import webbrowser
+        threading.Timer(0.5, webbrowser.open, (url,)).start()
 
-    # Start server
-    uvicorn.run("web.server:app", host=args.host, port=args.port, reload=False)
+    # Start server (pass the app object so uvicorn doesn't re-import it by name)
+    uvicorn.run(app, host=args.host, port=args.port, reload=False)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,126 @@
+"""Tests for the installation wizard orchestration.
+
+Components are replaced with fake installers, so nothing is probed or
+installed and state is kept in a temporary directory.
+"""
+
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import install_wizard.wizard as wizard_module
+from install_wizard.installers import ComponentInstaller, PythonPackageInstaller
+from install_wizard.state import InstallationStateManager
+
+
+class FakeInstaller(ComponentInstaller):
+    """Installer whose check result and fingerprint are set by the test."""
+
+    def __init__(self, name: str, result: bool = True, fingerprint: str = "fp1"):
+        super().__init__(name)
+        self.result = result
+        self.fingerprint = fingerprint
+        self.check_threads = []
+
+    def check(self) -> bool:
+        self.check_threads.append(threading.current_thread())
+        self.installed = self.result
+        return self.installed
+
+    def status_fingerprint(self):
+        return (f"fake:{self.name}", self.fingerprint)
+
+
+def make_wizard(tmp_path, components):
+    """Build a wizard whose components are the given installer lists."""
+    with patch.object(wizard_module, "INSTALL_DIR", tmp_path):
+        wizard = wizard_module.InstallationWizard()
+    wizard.components = {
+        comp_id: {"name": comp_id, "required": False, "installers_factory": factory}
+        for comp_id, factory in components.items()
+    }
+    return wizard
+
+
+class TestCheckAllComponents:
+    """Test concurrent, deduplicated and cached component checks."""
+
+    def test_each_installer_checked_once_on_the_pool(self, tmp_path):
+        """Every installer is checked exactly once, off the main thread."""
+        a, b = FakeInstaller("A"), FakeInstaller("B", result=False)
+        wizard = make_wizard(tmp_path, {"one": lambda: [a], "two": lambda: [a, b]})
+
+        status = wizard.check_all_components()
+
+        assert status == {"one": True, "two": False}
+        for installer in (a, b):
+            assert len(installer.check_threads) == 1
+            assert installer.check_threads[0] is not threading.main_thread()
+
+    def test_shared_pip_package_checked_once(self, tmp_path):
+        """A package listed by two components gets one installer and one check."""
+        wizard = make_wizard(tmp_path, {
+            "one": lambda: [PythonPackageInstaller("NumPy", "numpy")],
+            "two": lambda: [PythonPackageInstaller("NumPy", "numpy")],
+        })
+        assert wizard.get_installers("one")[0] is wizard.get_installers("two")[0]
+
+        with patch.object(PythonPackageInstaller, "check", autospec=True, return_value=False) as check:
+            status = wizard.check_all_components()
+
+        assert check.call_count == 1
+        assert status == {"one": False, "two": False}
+
+    def test_passed_check_cached_until_fingerprint_changes(self, tmp_path):
+        """A passed check is reused by a later run until its fingerprint changes."""
+        a = FakeInstaller("A")
+        wizard = make_wizard(tmp_path, {"one": lambda: [a]})
+        wizard.check_all_components()
+
+        # A new wizard reads the result back from install_state.json
+        wizard = make_wizard(tmp_path, {"one": lambda: [a]})
+        assert wizard.check_all_components() == {"one": True}
+        assert len(a.check_threads) == 1
+
+        a.fingerprint = "fp2"
+        a.result = False
+        assert wizard.check_all_components() == {"one": False}
+        assert len(a.check_threads) == 2
+
+    def test_failed_check_not_cached(self, tmp_path):
+        """A failed check runs again, so a transient failure doesn't stick."""
+        a = FakeInstaller("A", result=False)
+        wizard = make_wizard(tmp_path, {"one": lambda: [a]})
+        assert wizard.check_all_components() == {"one": False}
+        state = InstallationStateManager(tmp_path / "install_state.json")
+        assert state.get_cached_check("fake:A", "fp1") is None
+
+        a.result = True
+        assert wizard.check_all_components() == {"one": True}
+        assert len(a.check_threads) == 2
+
+
+class TestInstallComponent:
+    """Test install ordering within a component."""
+
+    def test_declared_order_kept_around_pip_runs(self, tmp_path):
+        """Consecutive pip packages are batched without moving other installers."""
+        order = []
+        pip_a = PythonPackageInstaller("A", "pkg_a")
+        pip_b = PythonPackageInstaller("B", "pkg_b")
+        pip_c = PythonPackageInstaller("C", "pkg_c")
+        repo = FakeInstaller("Repo", result=False)
+        repo.install = lambda: order.append(["Repo"]) or True
+        wizard = make_wizard(tmp_path, {"one": lambda: [pip_a, pip_b, repo, pip_c]})
+
+        def batch(installers):
+            order.append([installer.name for installer in installers])
+            return True
+
+        with patch.object(wizard, "_batch_pip_install", side_effect=batch):
+            assert wizard.install_component("one") is True
+
+        assert order == [["A", "B"], ["Repo"], ["C"]]
@@ -0,0 +1,124 @@
+"""Tests for the installation wizard component installers.
+
+Commands are mocked; nothing is cloned or installed.
+"""
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from install_wizard.conda import CondaEnvironmentManager
+from install_wizard.installers import GitRepoInstaller, PythonPackageInstaller
+
+
+def _killed_clone(installer):
+    """Fake a clone that is killed after creating .git."""
+    def clone(cmd, **kwargs):
+        (installer.install_dir / ".git").mkdir(parents=True)
+        return False, ""
+    return clone
+
+
+class TestGitRepoClone:
+    """Test clone failure handling."""
+
+    def test_killed_clone_is_discarded(self, tmp_path):
+        """A partial checkout is removed so check() doesn't report it installed."""
+        installer = GitRepoInstaller("Repo", "https://example.invalid/repo.git", tmp_path / "repo")
+        with patch("install_wizard.installers.run_command", side_effect=_killed_clone(installer)):
+            assert installer.install() is False
+        assert not installer.install_dir.exists()
+        assert installer.check() is False
+
+    def test_killed_async_clone_is_discarded(self, tmp_path):
+        """clone_async cleans up too, so install() retries the clone."""
+        installer = GitRepoInstaller("Repo", "https://example.invalid/repo.git", tmp_path / "repo")
+        fake = _killed_clone(installer)
+
+        async def clone(cmd, **kwargs):
+            return fake(cmd)
+
+        with patch("install_wizard.installers.run_command_async", side_effect=clone):
+            assert asyncio.run(installer.clone_async()) is False
+        assert installer.check() is False
+
+    def test_existing_directory_is_kept(self, tmp_path):
+        """A directory that predates the clone is never removed."""
+        install_dir = tmp_path / "repo"
+        install_dir.mkdir()
+        (install_dir / "user_file.txt").write_text("keep me")
+        installer = GitRepoInstaller("Repo", "https://example.invalid/repo.git", install_dir)
+        with patch("install_wizard.installers.run_command", return_value=(False, "")):
+            assert installer.install() is False
+        assert (install_dir / "user_file.txt").exists()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix conda layout")
+class TestStatusFingerprint:
+    """Test the site-packages fingerprint behind the persistent check cache."""
+
+    def setup_method(self):
+        self.manager = CondaEnvironmentManager(env_name="vfx")
+        self.manager.conda_exe = "conda"
+
+    def _fake_conda(self, tmp_path, env_root=None):
+        """Lay out <root>/bin/conda and an env's site-packages under env_root."""
+        conda_bin = tmp_path / "conda" / "bin" / "conda"
+        conda_bin.parent.mkdir(parents=True)
+        conda_bin.touch()
+        env_root = env_root or tmp_path / "conda" / "envs"
+        site_packages = env_root / "vfx" / "lib" / "python3.10" / "site-packages"
+        site_packages.mkdir(parents=True)
+        return str(conda_bin), site_packages
+
+    def test_env_under_conda_root(self, tmp_path):
+        """<root>/envs/<name> is found from the conda binary's location."""
+        conda_bin, site_packages = self._fake_conda(tmp_path)
+        with patch("install_wizard.conda.shutil.which", return_value=conda_bin):
+            assert self.manager.get_site_packages() == site_packages
+
+    def test_env_under_home(self, tmp_path):
+        """Envs created in ~/.conda/envs are found when the root has none."""
+        home = tmp_path / "home"
+        conda_bin, site_packages = self._fake_conda(tmp_path, home / ".conda" / "envs")
+        with patch("install_wizard.conda.shutil.which", return_value=conda_bin), \
+                patch("install_wizard.conda.Path.home", return_value=home):
+            assert self.manager.get_site_packages() == site_packages
+
+    def test_base_env_not_located(self, tmp_path):
+        """The base env has no envs/<name> directory, so nothing is cached."""
+        conda_bin, _ = self._fake_conda(tmp_path)
+        self.manager.env_name = "base"
+        installer = PythonPackageInstaller("NumPy", "numpy")
+        installer.set_conda_manager(self.manager)
+        with patch("install_wizard.conda.shutil.which", return_value=conda_bin), \
+                patch("install_wizard.conda.Path.home", return_value=tmp_path / "home"):
+            assert self.manager.get_site_packages() is None
+            assert installer.status_fingerprint() is None
+
+    def test_fingerprint_key_and_install_invalidation(self, tmp_path):
+        """The key carries min_version; a new package dir changes the fingerprint."""
+        conda_bin, site_packages = self._fake_conda(tmp_path)
+        installer = PythonPackageInstaller("PyTorch", "torch", min_version="2.1")
+        installer.set_conda_manager(self.manager)
+        with patch("install_wizard.conda.shutil.which", return_value=conda_bin):
+            key, before = installer.status_fingerprint()
+            assert key == "pip:vfx:torch>=2.1"
+            assert before.startswith(f"{site_packages}@")
+
+            # What a pip install does to site-packages
+            (site_packages / "torch").mkdir()
+            stat = site_packages.stat()
+            os.utime(site_packages, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            assert installer.status_fingerprint() == (key, f"{site_packages}@{site_packages.stat().st_mtime_ns}")
+            assert installer.status_fingerprint()[1] != before
+
+    def test_no_fingerprint_without_conda(self):
+        """Without conda the check is an in-process probe and isn't cached."""
+        assert PythonPackageInstaller("NumPy", "numpy").status_fingerprint() is None
@@ -0,0 +1,122 @@
+"""Tests for the installation wizard utility helpers.
+
+Tests package/command probing used by component checks and the
+persistent check cache.
+"""
+
+import json
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from install_wizard.state import InstallationStateManager
+from install_wizard.utils import (
+    check_command_available,
+    check_python_package,
+    invalidate_check_caches,
+    version_at_least,
+)
+
+
+class TestCheckPythonPackage:
+    """Test Python package detection."""
+
+    def setup_method(self):
+        invalidate_check_caches()
+
+    def test_installed_package_found(self):
+        """Standard library modules are detected."""
+        assert check_python_package("json") is True
+
+    def test_missing_package_not_found(self):
+        """Missing packages return False."""
+        assert check_python_package("nonexistent_package_xyz") is False
+
+    def test_import_name_used(self):
+        """import_name overrides the package name for lookup."""
+        assert check_python_package("not-a-module-name", "json") is True
+
+    def test_dotted_name_with_missing_parent(self):
+        """Dotted names with a missing parent return False instead of raising."""
+        assert check_python_package("nonexistent_parent_xyz.child") is False
+
+    def test_probe_does_not_import_module(self):
+        """Default probe locates the module without executing it."""
+        sys.modules.pop("this", None)
+        assert check_python_package("this") is True
+        assert "this" not in sys.modules
+
+    def test_deep_check_imports_module(self):
+        """deep=True actually imports the module."""
+        assert check_python_package("json", deep=True) is True
+        assert check_python_package("nonexistent_package_xyz", deep=True) is False
+
+
+class TestProbeCaching:
+    """Test memoization of probe helpers."""
+
+    def setup_method(self):
+        invalidate_check_caches()
+
+    @patch("install_wizard.utils.shutil.which", return_value="/usr/bin/git")
+    def test_command_lookup_cached(self, mock_which):
+        """Repeated command checks only walk PATH once."""
+        assert check_command_available("git") is True
+        assert check_command_available("git") is True
+        assert mock_which.call_count == 1
+
+    @patch("install_wizard.utils.shutil.which")
+    def test_invalidate_clears_command_cache(self, mock_which):
+        """invalidate_check_caches forces a fresh lookup."""
+        mock_which.return_value = None
+        assert check_command_available("ffmpeg") is False
+        mock_which.return_value = "/usr/bin/ffmpeg"
+        assert check_command_available("ffmpeg") is False
+        invalidate_check_caches()
+        assert check_command_available("ffmpeg") is True
+
+
+class TestVersionAtLeast:
+    """Test minimum version comparison."""
+
+    def test_release_versions(self):
+        assert version_at_least("2.1.0", "2.1") is True
+        assert version_at_least("1.26.4", "2.0") is False
+
+    def test_local_and_pre_releases(self):
+        """Local build tags satisfy the release; pre-releases don't."""
+        assert version_at_least("2.1.0+cu121", "2.1.0") is True
+        assert version_at_least("2.0.0rc1", "2.0.0") is False
+
+
+class TestCheckCache:
+    """Test the persistent installer check cache."""
+
+    def test_cached_result_survives_reload(self, tmp_path):
+        """Cached checks are read back by a new state manager."""
+        state_file = tmp_path / "install_state.json"
+        InstallationStateManager(state_file).cache_checks({"pip:env:numpy": ("sp@1", True)})
+        assert InstallationStateManager(state_file).get_cached_check("pip:env:numpy", "sp@1") is True
+
+    def test_changed_fingerprint_misses(self, tmp_path):
+        """A different fingerprint forces a fresh check."""
+        manager = InstallationStateManager(tmp_path / "install_state.json")
+        manager.cache_checks({"pip:env:numpy": ("sp@1", True)})
+        assert manager.get_cached_check("pip:env:numpy", "sp@2") is None
+        assert manager.get_cached_check("pip:env:torch", "sp@1") is None
+
+    def test_checks_written_to_state_file(self, tmp_path):
+        """Results land under "checks" in install_state.json, next to the other state."""
+        state_file = tmp_path / "install_state.json"
+        manager = InstallationStateManager(state_file)
+        manager.mark_component_started("core")
+        manager.cache_checks({"pip:env:numpy": ("sp@1", True), "pip:env:torch": ("sp@1", True)})
+
+        state = json.loads(state_file.read_text())
+        assert state["checks"]["pip:env:numpy"] == {"fingerprint": "sp@1", "installed": True}
+        assert "core" in state["components"]
+
+        reloaded = InstallationStateManager(state_file)
+        assert reloaded.get_cached_check("pip:env:torch", "sp@1") is True
@@ -40,10 +40,25 @@ class TestPlatformDetection:
         expected = sys.platform == "win32"
         assert _is_windows() == expected
 
+    def test_is_wsl2_matches_environment(self):
+        """is_wsl2() agrees with the detected environment."""
+        _, environment, _ = PlatformManager.detect_platform()
+        assert PlatformManager.is_wsl2() == (environment == "wsl2")
+
+    def test_get_context_matches_detect_platform(self):
+        """get_context bundles detect_platform and is cached."""
+        ctx = PlatformManager.get_context()
+        assert (ctx.os_name, ctx.environment, ctx.pkg_manager) == PlatformManager.detect_platform()
+        assert ctx.is_wsl2 == PlatformManager.is_wsl2()
+        assert PlatformManager.get_context() is ctx
+
 
 class TestFindTool:
     """Test cross-platform tool finding."""
 
+    def setup_method(self):
+        PlatformManager.invalidate_tool_cache()
+
     def test_find_tool_returns_path_or_none(self):
         """find_tool returns Path or None."""
         result = PlatformManager.find_tool("nonexistent_tool_xyz")
@@ -86,6 +101,26 @@ class TestFindTool:
             if result:
                 assert str(tmp) in str(result)
 
+    @patch("install_wizard.platform.shutil.which", return_value="/usr/bin/mytool")
+    def test_found_tool_is_cached(self, mock_which):
+        """Repeated lookups of a found tool only search once."""
+        with patch.object(PlatformManager, "_get_local_tool_paths", return_value=[]):
+            assert PlatformManager.find_tool("mytool") == Path("/usr/bin/mytool")
+            assert PlatformManager.find_tool("mytool") == Path("/usr/bin/mytool")
+        assert mock_which.call_count == 1
+
+    @patch("install_wizard.platform.shutil.which", return_value=None)
+    def test_missing_tool_is_cached_until_invalidated(self, mock_which):
+        """Misses are cached too, and invalidate_tool_cache forgets them."""
+        with patch.object(PlatformManager, "_get_local_tool_paths", return_value=[]):
+            assert PlatformManager.find_tool("nonexistent_tool_xyz") is None
+            assert PlatformManager.find_tool("nonexistent_tool_xyz") is None
+            assert mock_which.call_count == 1
+
+            PlatformManager.invalidate_tool_cache("nonexistent_tool_xyz")
+            mock_which.return_value = "/usr/bin/nonexistent_tool_xyz"
+            assert PlatformManager.find_tool("nonexistent_tool_xyz") == Path("/usr/bin/nonexistent_tool_xyz")
+
 
 class TestGetLocalToolPaths:
     """Test repo-local tool path generation."""
@@ -112,15 +147,15 @@ class TestWindowsToolPaths:
     """Test Windows-specific tool path handling."""
 
     def test_returns_list_for_known_tools(self):
-        """_get_windows_tool_paths returns list for known tools."""
+        """_get_windows_tool_paths returns a tuple for known tools."""
         for tool in ["colmap", "ffmpeg", "ffprobe", "7z", "nvidia-smi", "nvcc"]:
             result = PlatformManager._get_windows_tool_paths(tool)
-            assert isinstance(result, list)
+            assert isinstance(result, tuple)
 
     def test_returns_empty_for_unknown_tools(self):
-        """_get_windows_tool_paths returns empty list for unknown tools."""
+        """_get_windows_tool_paths returns an empty tuple for unknown tools."""
         result = PlatformManager._get_windows_tool_paths("unknown_tool_xyz")
-        assert result == []
+        assert result == ()
 
     def test_colmap_paths_include_bat(self):
         """COLMAP paths include .bat extension on Windows."""
@@ -139,15 +174,15 @@ class TestUnixToolPaths:
     """Test Unix-specific tool path handling."""
 
     def test_returns_list_for_known_tools(self):
-        """_get_unix_tool_paths returns list for known tools."""
+        """_get_unix_tool_paths returns a tuple for known tools."""
         for tool in ["colmap", "ffmpeg", "ffprobe", "7z", "aria2c"]:
             result = PlatformManager._get_unix_tool_paths(tool)
-            assert isinstance(result, list)
+            assert isinstance(result, tuple)
 
     def test_returns_empty_for_unknown_tools(self):
-        """_get_unix_tool_paths returns empty list for unknown tools."""
+        """_get_unix_tool_paths returns an empty tuple for unknown tools."""
         result = PlatformManager._get_unix_tool_paths("unknown_tool_xyz")
-        assert result == []
+        assert result == ()
 
     def test_paths_in_standard_locations(self):
         """Paths are in standard Unix locations."""
@@ -186,6 +221,14 @@ class TestRunTool:
         call_kwargs = mock_run.call_args[1]
         assert call_kwargs.get("shell") is True
 
+    @patch("install_wizard.platform._is_windows", return_value=False)
+    @patch("install_wizard.platform.os.execv", side_effect=SystemExit)
+    def test_replace_process_execs_tool(self, mock_execv, mock_is_win):
+        """replace_process hands the process over to the tool on POSIX."""
+        with pytest.raises(SystemExit):
+            PlatformManager.run_tool(Path("/usr/bin/colmap"), ["gui"], replace_process=True)
+        mock_execv.assert_called_once_with("/usr/bin/colmap", ["/usr/bin/colmap", "gui"])
+
 
 class TestToolDownloads:
     """Test tool download URL configuration."""